@@ -3,8 +3,19 @@ Provoke: A specialized web crawler and search engine for high-quality personal b
 """
 
 from provoke.config import config, evaluate_page_quality
-from provoke.config import config, evaluate_page_quality
-from provoke.crawler import AsyncCrawler
-from provoke.indexer import SearchEngine
 
 __all__ = ["config", "evaluate_page_quality", "AsyncCrawler", "SearchEngine"]
+
+
+def __getattr__(name):
+    # The crawler and indexer pull in aiohttp, playwright and redis; load them
+    # on first access so `import provoke.config` stays cheap for workers.
+    if name == "AsyncCrawler":
+        from provoke.crawler import AsyncCrawler
+
+        return AsyncCrawler
+    if name == "SearchEngine":
+        from provoke.indexer import SearchEngine
+
+        return SearchEngine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -15,15 +15,24 @@ Usage:
 
 import os
 import re
+import threading
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from html import unescape
 from urllib.parse import urlparse
 import warnings
-from bs4 import BeautifulSoup, XMLParsedAsHTMLWarning
-import textstat
+from bs4 import XMLParsedAsHTMLWarning
+from lxml import etree
+from lxml import html as lxml_html
 
 # Suppress the XMLParsedAsHTMLWarning which triggers when BeautifulSoup
 # encounters RSS feeds or XML-like content while using the lxml HTML parser.
 warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
 
+if TYPE_CHECKING:
+    from provoke.utils.landing_page import PageSignals
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -202,6 +211,12 @@ class _BaseConfig:
     ML_EPOCHS: int = 25
     ML_WORD_NGRAMS: int = 2
     ML_EMBEDDING_DIM: int = 100
+    ML_LOSS: str = "hs"  # Hierarchical softmax; as accurate as softmax for good/bad
+    ML_THREADS: int = os.cpu_count() or 1
+    # Product-quantize the saved model: ~100x smaller, but training takes ~50x
+    # longer, so it is off for the retraining loop (use trainer --quantize)
+    ML_QUANTIZE: bool = False
+    ML_QUANTIZE_CUTOFF: int = 100000  # Max words/ngrams kept when quantizing
     ML_VERBOSE: int = 2
     ML_TEST_RATIO: float = 0.25
     ML_CONFIDENCE_THRESHOLD: float = 0.8  # For check_model_stats analysis
@@ -230,6 +245,10 @@ class _BaseConfig:
         r"forum",
         r"changelog",
     ]
+    # All title patterns combined into one case-insensitive search
+    EXCLUDED_TITLE_RE: re.Pattern = re.compile(
+        "|".join(f"(?:{p})" for p in EXCLUDED_TITLE_PATTERNS), re.IGNORECASE
+    )
 
     # ── Excluded URL Patterns ─────────────────────────────────────────────
     EXCLUDED_URL_PATTERNS: list = [
@@ -272,6 +291,10 @@ class _BaseConfig:
         r"crates\.io",
         r"pypi\.org",
     ]
+    # All URL patterns combined into one case-insensitive search
+    EXCLUDED_URL_RE: re.Pattern = re.compile(
+        "|".join(f"(?:{p})" for p in EXCLUDED_URL_PATTERNS), re.IGNORECASE
+    )
 
     # ── CTA / Marketing ───────────────────────────────────────────────────
     CTA_PHRASES: list = [
@@ -460,6 +483,14 @@ class _BaseConfig:
         ".msi",
     }
 
+    # Single tail-matcher for BINARY_EXTENSIONS (tolerates a trailing query/fragment)
+    BINARY_EXT_RE: re.Pattern = re.compile(
+        r"\.(?:"
+        + "|".join(sorted(re.escape(ext[1:]) for ext in BINARY_EXTENSIONS))
+        + r")(?:[?#]|$)",
+        re.IGNORECASE,
+    )
+
 
 # ---------------------------------------------------------------------------
 # Environment Overrides
@@ -502,6 +533,8 @@ THRESHOLDS = config.THRESHOLDS
 ML_CONFIG = config.ML_CONFIG
 EXCLUDED_TITLE_PATTERNS = config.EXCLUDED_TITLE_PATTERNS
 EXCLUDED_URL_PATTERNS = config.EXCLUDED_URL_PATTERNS
+EXCLUDED_TITLE_RE = config.EXCLUDED_TITLE_RE
+EXCLUDED_URL_RE = config.EXCLUDED_URL_RE
 CTA_PHRASES = config.CTA_PHRASES
 MARKETING_TOOLS = config.MARKETING_TOOLS
 AD_NETWORKS = config.AD_NETWORKS
@@ -509,6 +542,7 @@ TRACKING_SCRIPTS = config.TRACKING_SCRIPTS
 AD_ELEMENT_PATTERNS = config.AD_ELEMENT_PATTERNS
 PERSONAL_DOMAIN_KEYWORDS = config.PERSONAL_DOMAIN_KEYWORDS
 BINARY_EXTENSIONS = config.BINARY_EXTENSIONS
+BINARY_EXT_RE = config.BINARY_EXT_RE
 BLACKLISTED_AD_SCRIPTS = config.BLACKLISTED_AD_SCRIPTS
 
 
@@ -516,126 +550,180 @@ BLACKLISTED_AD_SCRIPTS = config.BLACKLISTED_AD_SCRIPTS
 # Quality Filter Logic (Moved from quality_filter.py)
 # ---------------------------------------------------------------------------
 
-# Common English stopwords to help identify natural language content
-STOPWORDS = {
-    "the",
-    "and",
-    "a",
-    "of",
-    "to",
-    "is",
-    "in",
-    "it",
-    "i",
-    "that",
-    "you",
-    "it",
-    "for",
-    "on",
-    "was",
-    "with",
-    "as",
-    "are",
-    "by",
-    "be",
-    "this",
-    "had",
-    "from",
-    "at",
-    "which",
-    "or",
-    "have",
-    "an",
-    "they",
-    "which",
-    "one",
-    "you",
-    "were",
-    "her",
-    "all",
-    "she",
-    "there",
-    "would",
-    "their",
-    "we",
-    "him",
-    "been",
-    "has",
-    "when",
-    "who",
-    "will",
-    "no",
-    "if",
-    "out",
-    "so",
-    "up",
-    "can",
-    "their",
-    "about",
-    "more",
-    "some",
-    "my",
-    "into",
-    "their",
-    "only",
-    "other",
-    "them",
-    "then",
-    "now",
-}
+def _as_literal(pattern: str) -> str | None:
+    """
+    Return the exact string a regex matches when it contains no
+    metacharacters (escaped punctuation is allowed), else None.
+    """
+    literal = []
+    chars = iter(pattern)
+    for ch in chars:
+        if ch == "\\":
+            escaped = next(chars, "")
+            if not escaped or escaped.isalnum():
+                return None  # \b, \d, ... or a dangling backslash
+            literal.append(escaped)
+        elif ch in ".^$*+?{}[]|()":
+            return None
+        else:
+            literal.append(ch)
+    return "".join(literal)
+
 
+def _literal_or_compiled(pattern: str) -> str | re.Pattern:
+    """Fixed strings are searched with str methods (about 2x faster than re)."""
+    literal = _as_literal(pattern)
+    return literal if literal is not None else re.compile(pattern)
 
-def calculate_text_ratio(html_content: str) -> float:
+
+# Patterns used by the scorers, prepared once at import rather than looked up
+# in re's cache (with their flags) on every call.
+_TRACKING_SCRIPT_RES = tuple(_literal_or_compiled(p) for p in config.TRACKING_SCRIPTS)
+_AD_ELEMENT_RES = tuple(_literal_or_compiled(p) for p in config.AD_ELEMENT_PATTERNS)
+# Any-network probe for the (already lowercased) src/href values; most URLs
+# match no network, so the per-network loop only runs for the few that do.
+_AD_NETWORK_RE = re.compile("|".join(re.escape(n) for n in config.AD_NETWORKS))
+# Word boundaries avoid substring hits (e.g., 'me' in 'merch')
+_PERSONAL_KEYWORD_RES = tuple(
+    re.compile(rf"\b{re.escape(kw)}\b", re.IGNORECASE)
+    for kw in config.PERSONAL_DOMAIN_KEYWORDS
+)
+
+# Common English stopwords to help identify natural language content
+STOPWORDS = frozenset(
+    {
+        "the",
+        "and",
+        "a",
+        "of",
+        "to",
+        "is",
+        "in",
+        "it",
+        "i",
+        "that",
+        "you",
+        "for",
+        "on",
+        "was",
+        "with",
+        "as",
+        "are",
+        "by",
+        "be",
+        "this",
+        "had",
+        "from",
+        "at",
+        "which",
+        "or",
+        "have",
+        "an",
+        "they",
+        "one",
+        "were",
+        "her",
+        "all",
+        "she",
+        "there",
+        "would",
+        "their",
+        "we",
+        "him",
+        "been",
+        "has",
+        "when",
+        "who",
+        "will",
+        "no",
+        "if",
+        "out",
+        "so",
+        "up",
+        "can",
+        "about",
+        "more",
+        "some",
+        "my",
+        "into",
+        "only",
+        "other",
+        "them",
+        "then",
+        "now",
+    }
+)
+
+
+# <title> is raw text in HTML (no child tags), so a regex finds it without a parse
+_TITLE_RE = re.compile(r"<title\b[^>]*>([^<]*)</title", re.IGNORECASE)
+
+
+# Tags whose text never counts as content for calculate_text_ratio
+_NON_CONTENT_TAGS = (
+    "script",
+    "style",
+    "svg",
+    "path",
+    "canvas",
+    "video",
+    "audio",
+    "iframe",
+    "comment",
+    "nav",
+    "header",
+    "footer",
+    "noscript",
+    "meta",
+    "link",
+    "aside",
+    "form",
+    "dialog",
+    "button",
+    "select",
+    "input",
+    "textarea",
+    "label",
+    "img",
+    "picture",
+    "head",
+)
+
+
+def calculate_text_ratio(html_content: str, tree=None) -> float:
     """
     Calculates an adjusted ratio of meaningful text to HTML weight.
     Incorporates link density penalties and language signals (stopwords).
+    Works on an lxml tree: stripping and text extraction run in C,
+    several times faster than the equivalent BeautifulSoup calls.
+    A tree from parse_document() may be passed to reuse an earlier parse;
+    non-content tags are stripped from it in place.
     """
+    from provoke.utils.landing_page import parse_document
+
     if not html_content:
         return 0.0
 
-    soup = BeautifulSoup(html_content, "lxml")
-    body = soup.body if soup.body else soup
+    if tree is None:
+        tree = parse_document(html_content)
+    if tree is None:
+        return 0.0
+    body = tree.find("body")
+    if body is None:
+        body = tree
 
     # 1. Strip definitely non-content tags from both numerator and denominator
-    tags_to_strip = [
-        "script",
-        "style",
-        "svg",
-        "path",
-        "canvas",
-        "video",
-        "audio",
-        "iframe",
-        "comment",
-        "nav",
-        "header",
-        "footer",
-        "noscript",
-        "meta",
-        "link",
-        "aside",
-        "form",
-        "dialog",
-        "button",
-        "select",
-        "input",
-        "textarea",
-        "label",
-        "img",
-        "picture",
-        "head",
-    ]
-    for element in body(tags_to_strip):
-        element.decompose()
+    etree.strip_elements(body, *_NON_CONTENT_TAGS, with_tail=False)
 
     # 2. Extract texts
-    all_text = body.get_text(separator=" ", strip=True)
+    # Same joining rules as bs4's get_text(separator=" ", strip=True)
+    all_text = " ".join(s for t in body.itertext() if (s := t.strip()))
     if not all_text:
         return 0.0
 
     # Calculate link text length to determine Link Density
-    links = body.find_all("a")
-    link_text = " ".join([a.get_text(strip=True) for a in links])
+    links = body.iter("a")
+    link_text = " ".join(["".join(t.strip() for t in a.itertext()) for a in links])
 
     total_len = len(all_text)
     link_len = len(link_text)
@@ -645,9 +733,11 @@ def calculate_text_ratio(html_content: str) -> float:
     link_density = link_len / total_len if total_len > 0 else 0
 
     # 3. Calculate HTML size (denominator)
-    # We use the cleaned structure weight
-    content_html = str(body)
-    content_html_size = len(content_html)
+    # We use the cleaned structure weight. Only the length is kept; the
+    # serialized copy is released straight away instead of living until return.
+    content_html_size = len(
+        lxml_html.tostring(body, encoding="unicode", with_tail=False)
+    )
 
     if content_html_size == 0:
         return 0.0
@@ -659,7 +749,8 @@ def calculate_text_ratio(html_content: str) -> float:
     # Natural language has a predictable density of common small words.
     words = all_text.lower().split()
     word_count = len(words)
-    stopword_count = sum(1 for w in words if w in STOPWORDS)
+    # filter() runs the membership test in C; no Python frame per word
+    stopword_count = len(list(filter(STOPWORDS.__contains__, words)))
     stopword_density = stopword_count / word_count if word_count > 0 else 0
 
     # 5. Perfect the ratio with adjustments
@@ -684,7 +775,11 @@ def calculate_text_ratio(html_content: str) -> float:
     return min(1.0, float(adjusted_ratio))
 
 
-def calculate_ad_score(html: str) -> tuple[int, int]:
+def calculate_ad_score(
+    html: str,
+    signals: "PageSignals | None" = None,
+    html_lower: str | None = None,
+) -> tuple[int, int]:
     """
     Calculates an 'ad score' (0-100) based on detected ad/tracking tech.
     Higher score means more ad-heavy.
@@ -693,10 +788,13 @@ def calculate_ad_score(html: str) -> tuple[int, int]:
         return 0, 0
 
     points = 0
-    html_lower = html.lower()
-    soup = BeautifulSoup(html, "lxml")
-
+    if html_lower is None:
+        html_lower = html.lower()
     from provoke.utils.adblock import get_ad_blocker
+    from provoke.utils.landing_page import extract_page_signals
+
+    if signals is None:
+        signals = extract_page_signals(html)
 
     ad_blocker = get_ad_blocker()
 
@@ -704,24 +802,30 @@ def calculate_ad_score(html: str) -> tuple[int, int]:
     networks_found = set()
 
     # Check scripts
-    for script in soup.find_all("script", src=True):
-        src = str(script["src"]).lower()
+    for tag, src in signals.srcs:
+        if tag != "script":
+            continue
         if ad_blocker.is_ad_url(src):
             networks_found.add("blacklisted_ad_script")
             points += 25  # High weight for blocked scripts
 
+        if _AD_NETWORK_RE.search(src) is None:
+            continue
         for network in config.AD_NETWORKS:
             if network in src:
                 networks_found.add(network)
                 points += 15  # Higher weight for actual script tags
 
     # Check links/iframes
-    for tag in soup.find_all(["link", "iframe", "a"], href=True):
-        href = str(tag.get("href", "")).lower()
+    for tag, href in signals.hrefs:
+        if tag == "script":
+            continue
         if ad_blocker.is_ad_url(href):
             networks_found.add("blacklisted_ad_link")
             points += 10
 
+        if _AD_NETWORK_RE.search(href) is None:
+            continue
         for network in config.AD_NETWORKS:
             if network in href:
                 networks_found.add(network)
@@ -729,18 +833,25 @@ def calculate_ad_score(html: str) -> tuple[int, int]:
 
     # 2. Check for tracking patterns in whole HTML (Breadth)
     trackers_found = 0
-    for pattern in config.TRACKING_SCRIPTS:
-        if re.search(pattern, html_lower):
+    for pattern in _TRACKING_SCRIPT_RES:
+        if isinstance(pattern, str):
+            found = pattern in html_lower
+        else:
+            found = pattern.search(html_lower) is not None
+        if found:
             trackers_found += 1
             points += 5
 
     # 3. Check for specific ad elements in HTML structure
-    for pattern in config.AD_ELEMENT_PATTERNS:
-        matches = re.findall(pattern, html_lower)
-        points += min(10, len(matches)) * 3
+    for pattern in _AD_ELEMENT_RES:
+        if isinstance(pattern, str):
+            match_count = html_lower.count(pattern)  # non-overlapping, like findall
+        else:
+            match_count = len(pattern.findall(html_lower))
+        points += min(10, match_count) * 3
 
     # 4. Detect multiple iframes (often used for ads)
-    iframe_count = len(soup.find_all("iframe"))
+    iframe_count = signals.iframe_count
     if iframe_count > 3:
         points += min(15, (iframe_count - 3) * 5)
 
@@ -748,7 +859,188 @@ def calculate_ad_score(html: str) -> tuple[int, int]:
     return ad_score, len(networks_found) + trackers_found
 
 
-def calculate_corporate_score(url: str, html: str, text: str) -> int:
+# URL path tokens for calculate_corporate_score. URLs are short, so one
+# alternation search beats a Python-level any() over the tokens (~4x).
+_CONTENT_PATH_RE = re.compile(
+    "|".join(
+        re.escape(p)
+        for p in (
+            "/blog/",
+            "/resources/",
+            "/insights/",
+            "/articles/",
+            "/posts/",
+            "/essays/",
+        )
+    )
+)
+_COMMERCIAL_PATH_RE = re.compile(
+    "|".join(
+        re.escape(p)
+        for p in (
+            "/pricing",
+            "/demo",
+            "/product",
+            "/solutions",
+            "/features",
+            "/enterprise",
+            "/services",
+            "/company",
+            "/platform",
+            "/checkout",
+            "/cart",
+            "/bylaws",
+            "/annual-reports",
+            "/sponsors",
+            "/documentation",
+            "/docs",
+            "/api-reference",
+        )
+    )
+)
+
+# Substring signals for calculate_corporate_score, grouped by category.
+# Each distinct keyword is searched for once per page (see _keyword_hits).
+_CORPORATE_HTML_KEYWORDS = {
+    # Social meta tags usually indicate professional marketing
+    "meta_signal": (
+        "og:site_name",
+        "twitter:site",
+        "fb:app_id",
+        "og:type",
+        "twitter:creator",
+    ),
+    # Generic "Business" / "Media" footer links
+    "footer": (
+        "privacy policy",
+        "terms of use",
+        "contact us",
+        "about us",
+        "cookie policy",
+        "legal",
+        "advertise",
+        "press",
+        "careers",
+        "newsletter",
+    ),
+}
+
+# Organisation-like schema types; only consulted for root pages that carry
+# structured data (see calculate_corporate_score).
+_ORG_SCHEMA_KEYWORDS = (
+    "organisation",
+    "organization",
+    "service",
+    "product",
+    "corporation",
+    "localbusiness",
+)
+
+_CORPORATE_TEXT_KEYWORDS = {
+    "aggregator": (
+        "originally appeared on",
+        "read more at",
+        "source:",
+        "via:",
+        "credit:",
+        "hat tip",
+        "reporting by",
+        "quotes are taken from",
+    ),
+    "mill": (
+        "latest stories",
+        "trending now",
+        "must read",
+        "you may also like",
+        "viral",
+        "top stories",
+        "stay tuned",
+        "subscribe to our push-notifications",
+    ),
+    "affiliate": (
+        "affiliate link",
+        "earn a commission",
+        "sponsored",
+        "disclosure:",
+        "advertisement",
+    ),
+    "sales_copy": (
+        "our customers",
+        "trusted by",
+        "case studies",
+        "solution for",
+        "maximize your",
+        "unleash",
+        "streamline your",
+        "next-generation",
+        "community platform",
+        "collaboration",
+        "foundation",
+        "non-profit",
+        "installation guide",
+        "quickstart",
+        "getting started",
+        "api reference",
+        "developer guide",
+        "system requirements",
+    ),
+}
+
+
+def _keyword_index(table: dict) -> tuple:
+    """Invert a {category: keywords} table into ((keyword, categories), ...)."""
+    index: dict[str, list[str]] = {}
+    for category, keywords in table.items():
+        for keyword in keywords:
+            index.setdefault(keyword, []).append(category)
+    return tuple((keyword, tuple(cats)) for keyword, cats in index.items())
+
+
+def _keyword_hits(haystack: str, index: tuple) -> Counter:
+    """
+    Count, per category, how many of its keywords occur in `haystack`.
+    Plain `in` checks are used on purpose: CPython's substring search beats a
+    single alternation regex over the same keywords by roughly 2-4x.
+    """
+    hits: Counter = Counter()
+    for keyword, categories in index:
+        if keyword in haystack:
+            for category in categories:
+                hits[category] += 1
+    return hits
+
+
+_CORPORATE_HTML_INDEX = _keyword_index(_CORPORATE_HTML_KEYWORDS)
+_CORPORATE_TEXT_INDEX = _keyword_index(_CORPORATE_TEXT_KEYWORDS)
+
+# Call-to-action button texts, broadened to catch media sites' "conversion" goals
+_CTA_KEYWORDS = (
+    "buy",
+    "purchase",
+    "demo",
+    "pricing",
+    "sign up",
+    "free trial",
+    "get started",
+    "subscribe",
+    "newsletter",
+    "follow us",
+    "join us",
+    "register",
+    "create account",
+)
+
+
+def calculate_corporate_score(
+    url: str,
+    html: str,
+    text: str,
+    signals: "PageSignals | None" = None,
+    html_lower: str | None = None,
+    text_lower: str | None = None,
+    url_path: str | None = None,
+    word_count: int | None = None,
+) -> int:
     """
     Comprehensive commercial/corporate/content-mill detection (0-100).
     Captures:
@@ -758,56 +1050,29 @@ def calculate_corporate_score(url: str, html: str, text: str) -> int:
     4. Lead-Gen & Squeeze Pages
     """
     from provoke.utils.landing_page import (
-        is_service_landing_page,
         is_ecommerce_page,
         is_homepage_not_article,
         detect_spam_services,
         count_buttons_with_text,
+        fast_url_path,
     )
-    from urllib.parse import urlparse
 
     score = 0
     url_lower = url.lower()
-    html_lower = html.lower()
-    text_lower = text.lower()
-    parsed_url = urlparse(url)
+    if html_lower is None:
+        html_lower = html.lower()
+    if text_lower is None:
+        text_lower = text.lower()
+    if url_path is None:
+        url_path = fast_url_path(url)
 
     # 1. Content Protection (Negative points to help high-quality articles)
     # We only apply this if it's a deep path, not a generic one
-    if len(parsed_url.path.split("/")) > 2:
-        content_paths = [
-            "/blog/",
-            "/resources/",
-            "/insights/",
-            "/articles/",
-            "/posts/",
-            "/essays/",
-        ]
-        if any(p in url_lower for p in content_paths):
-            score -= 20
+    if url_path.count("/") > 1 and _CONTENT_PATH_RE.search(url_lower):
+        score -= 20
 
     # 2. Hard Commercial Signals
-    commercial_paths = [
-        "/pricing",
-        "/demo",
-        "/product",
-        "/solutions",
-        "/features",
-        "/enterprise",
-        "/services",
-        "/company",
-        "/platform",
-        "/checkout",
-        "/cart",
-        "/bylaws",
-        "/annual-reports",
-        "/sponsors",
-        "/documentation",
-        "/docs",
-        "/api-reference",
-        "/pricing",
-    ]
-    if any(p in url_lower for p in commercial_paths):
+    if _COMMERCIAL_PATH_RE.search(url_lower):
         # Docs are high corporate signal but not necessarily "commercial" in sales sense,
         # but they are definitely organizational.
         if "/docs" in url_lower or "/documentation" in url_lower:
@@ -816,182 +1081,193 @@ def calculate_corporate_score(url: str, html: str, text: str) -> int:
             score += 25
 
     # E-commerce detection
-    if is_ecommerce_page(html):
+    if is_ecommerce_page(html, html_lower=html_lower):
         score += 65
 
     # Spam/Lead-gen services
-    if detect_spam_services(url, text):
+    if detect_spam_services(url, text, text_lower=text_lower):
         score += 75
 
+    html_hits = _keyword_hits(html_lower, _CORPORATE_HTML_INDEX)
+    text_hits = _keyword_hits(text_lower, _CORPORATE_TEXT_INDEX)
+
     # Corporate / Service Schema
-    org_schemas = [
-        "organisation",
-        "organization",
-        "service",
-        "product",
-        "corporation",
-        "localbusiness",
-    ]
-    if any(s in html_lower for s in org_schemas) and '"@type"' in html_lower:
-        # Check for root specifically to avoid penalizing blog posts on subpaths
-        if parsed_url.path.strip("/") in ["", "index.html", "index.php"]:
-            score += 40
+    # Check for root specifically to avoid penalizing blog posts on subpaths.
+    # The path test and the single '"@type"' marker scan come first so that
+    # article pages skip the six schema keyword scans entirely.
+    if (
+        url_path.strip("/") in ("", "index.html", "index.php")
+        and '"@type"' in html_lower
+        and any(s in html_lower for s in _ORG_SCHEMA_KEYWORDS)
+    ):
+        score += 40
 
     # 3. Commercial Metadata (High signal for business sites)
-    # Social meta tags usually indicate professional marketing
-    meta_signals = [
-        "og:site_name",
-        "twitter:site",
-        "fb:app_id",
-        "og:type",
-        "twitter:creator",
-    ]
-    meta_hits = sum(5 for m in meta_signals if m in html_lower)
+    meta_hits = 5 * html_hits["meta_signal"]
     score += meta_hits  # Up to 25 points
 
     # 4. Content Mill & Aggregator Signals
-    # Generic "Business" / "Media" footer links
-    footer_keywords = [
-        "privacy policy",
-        "terms of use",
-        "contact us",
-        "about us",
-        "cookie policy",
-        "legal",
-        "advertise",
-        "press",
-        "careers",
-        "newsletter",
-    ]
-    footer_hits = sum(3 for kw in footer_keywords if kw in html_lower)
+    footer_hits = 3 * html_hits["footer"]
     score += min(footer_hits, 30)
 
     # Aggregator phrases
-    aggregator_phrases = [
-        "originally appeared on",
-        "read more at",
-        "source:",
-        "via:",
-        "credit:",
-        "hat tip",
-        "reporting by",
-        "quotes are taken from",
-    ]
-    if any(phrase in text_lower for phrase in aggregator_phrases):
+    if text_hits["aggregator"]:
         score += 30
 
     # Content Mill Clutter phrases
-    mill_phrases = [
-        "latest stories",
-        "trending now",
-        "must read",
-        "you may also like",
-        "viral",
-        "top stories",
-        "stay tuned",
-        "subscribe to our push-notifications",
-    ]
-    mill_hits = sum(5 for phrase in mill_phrases if phrase in text_lower)
+    mill_hits = 5 * text_hits["mill"]
     score += min(mill_hits, 25)
 
     # Affiliate / Ad-Revenue Signals
-    affiliate_signals = [
-        "affiliate link",
-        "earn a commission",
-        "sponsored",
-        "disclosure:",
-        "advertisement",
-    ]
-    if any(sig in text_lower for sig in affiliate_signals):
+    if text_hits["affiliate"]:
         score += 35
 
     # 5. Engagement Intensity (CTAs)
-    # Broadened to catch media sites' "conversion" goals
-    cta_keywords = [
-        "buy",
-        "purchase",
-        "demo",
-        "pricing",
-        "sign up",
-        "free trial",
-        "get started",
-        "subscribe",
-        "newsletter",
-        "follow us",
-        "join us",
-        "register",
-        "create account",
-    ]
-    # CTA score should be less significant for long-form content
-    cta_count = count_buttons_with_text(html, cta_keywords)
-    word_count = len(text.split())
+    # CTA score should be less significant for long-form content.
+    # Both branches saturate at 5 keywords, so counting can stop there.
+    cta_count = count_buttons_with_text(
+        html, _CTA_KEYWORDS, signals=signals, limit=5
+    )
+    if word_count is None:
+        word_count = len(text.split())
     if word_count > 600:
         score += min(cta_count * 4, 20)
     else:
         score += min(cta_count * 8, 40)
 
     # 5.5. Personal Blog Signals (Negative score = better)
-    personal_keywords = config.PERSONAL_DOMAIN_KEYWORDS
-    # Use word boundary to avoid matching substring (e.g., 'me' in 'merch')
+    # Both haystacks are already lowercased, so the IGNORECASE patterns are
+    # safe to share between the URL and the text lead.
     personal_hits = 0
-    for kw in personal_keywords:
-        pattern = rf"\b{re.escape(kw)}\b"
-        if re.search(pattern, url_lower) or re.search(
-            pattern, text_lower[:800], re.IGNORECASE
-        ):
+    text_lead = text_lower[:800]
+    for pattern in _PERSONAL_KEYWORD_RES:
+        if pattern.search(url_lower) or pattern.search(text_lead):
             personal_hits += 1
 
     score -= min(personal_hits * 10, 30)
 
     # 6. Service Description Language (Sales Copy)
-    sales_copy = [
-        "our customers",
-        "trusted by",
-        "case studies",
-        "solution for",
-        "maximize your",
-        "unleash",
-        "streamline your",
-        "next-generation",
-        "community platform",
-        "collaboration",
-        "foundation",
-        "non-profit",
-        "installation guide",
-        "quickstart",
-        "getting started",
-        "api reference",
-        "developer guide",
-        "system requirements",
-    ]
-    if any(phrase in text_lower for phrase in sales_copy):
+    if text_hits["sales_copy"]:
         score += 25
 
     # 7. Normalization and Tuning
     # If the page is essentially an empty container for a feed
-    if is_homepage_not_article(url, html):
+    if is_homepage_not_article(url_path, html):
         score += 30
 
     final_score = max(0, min(100, score))
     return final_score
 
 
-def calculate_readability(text: str) -> float:
-    """Calculates Flesch Reading Ease score."""
-    try:
-        # textstat can be tricky with its module/class structure in different versions
-        method = getattr(textstat, "flesch_reading_ease", None)
-        if not method:
-            from textstat import textstat as ts_module
+# Recent readability scores keyed by (len, hash) of the text, so refilter runs
+# over the same pages skip the syllable pass without pinning the texts.
+_READABILITY_CACHE_SIZE = 1024
+_readability_cache: OrderedDict = OrderedDict()
+_readability_lock = threading.Lock()
 
-            method = getattr(ts_module, "flesch_reading_ease", None)
 
-        if method:
-            return method(text)
+def calculate_readability(text: str) -> float:
+    """Calculates Flesch Reading Ease score."""
+    # No words: the formula divides by the word count, so the score is 0.0
+    if not text or text.isspace():
         return 0.0
-    except:
+
+    key = (len(text), hash(text))
+    with _readability_lock:
+        if key in _readability_cache:
+            _readability_cache.move_to_end(key)
+            return _readability_cache[key]
+
+    score = _flesch_reading_ease(text)
+    with _readability_lock:
+        _readability_cache[key] = score
+        if len(_readability_cache) > _READABILITY_CACHE_SIZE:
+            _readability_cache.popitem(last=False)
+    return score
+
+
+# Flesch Reading Ease is computed directly rather than through textstat,
+# whose English syllable counts need nltk's cmudict (downloaded at runtime).
+# Word and sentence splitting follow textstat: punctuation other than
+# contraction apostrophes is dropped, and fragments of <= 2 words are not
+# counted as sentences.
+_PUNCTUATION_RE = re.compile(r"[^\w\s']|'(?!(?:[tsd]|ve|ll|re))")
+_SENTENCE_RE = re.compile(r"\b[^.!?]+[.!?]*")
+_VOWEL_GROUP_RE = re.compile(r"[aeiouy]+")
+_VOWEL_ING_RE = re.compile(r"[aeiouy]ing$")
+# Adjacent vowels spoken as two syllables (vi-a, cre-ate, qui-et, sci-ence);
+# each match adds one to the vowel-group count
+_HIATUS_RE = re.compile(
+    r"(?<![cstgx])i[ao](?![ln]\b)"  # via, radio, variable (not -tion, -cial)
+    r"|(?<![qg])u[ao]"  # usually, duo (not quality, language)
+    r"|(?<![pg])eo(?!r)"  # video, neon (not people, pigeon, theory)
+    r"|ea\b|^crea"  # idea, area, create
+    r"|ie(?=t)|(?<![ct])ie(?=n[ct])|(?<=sc)ie"  # quiet, client, science
+    r"|oe[mt]"  # poem, poet
+    r"|(?<![qg])ue[lnt]"  # cruel, fluent
+    r"|uou"  # ambiguous
+)
+# Endings whose final vowel is still pronounced: consonant + le (table),
+# -ee/-ie/-ye, and -ue after a consonant other than g/q (value, not league)
+_VOICED_E_RE = re.compile(r"(?:[^aeiouyl]l|[eiy]|[^aeiouygq]u)e$")
+# -ed is its own syllable after t/d and consonant + l (wanted, enabled), and
+# merges into a preceding vowel group (played, specified)
+_VOICED_ED_RE = re.compile(r"(?:[td]|[aeiouy]|[^aeiouyl]l)ed$")
+# Plural/verb '-es' endings that add a syllable (boxes, pages, wishes, tables)
+_VOICED_ES_RE = re.compile(r"(?:[sxzcg]|ch|sh|[ie]|[^aeiouyl]l|[^aeiouygq]u)es$")
+# Suffixes after which a stem's silent -e stays silent (like-ly, state-ment)
+_SILENT_E_SUFFIXES = ("ments", "ment", "ness", "less", "ful", "ly")
+
+
+@lru_cache(maxsize=50_000)
+def _count_syllables(word: str) -> int:
+    """Estimate the syllables of a lowercased word from its vowel groups."""
+    for suffix in _SILENT_E_SUFFIXES:
+        if word.endswith(suffix):
+            stem = word[: -len(suffix)]
+            if len(stem) >= 3 and stem.endswith("e"):
+                return _count_syllables(stem) + 1
+
+    count = len(_VOWEL_GROUP_RE.findall(word)) + len(_HIATUS_RE.findall(word))
+    if count > 1:
+        # Silent endings: make, jumped, makes (but table, wanted, boxes)
+        if word.endswith("e"):
+            if _VOICED_E_RE.search(word) is None:
+                count -= 1
+        elif word.endswith("ed"):
+            if _VOICED_ED_RE.search(word) is None:
+                count -= 1
+        elif word.endswith("es"):
+            if _VOICED_ES_RE.search(word) is None:
+                count -= 1
+    # basically, automatically: the "a" of -ically is not spoken
+    if word.endswith("ically"):
+        count -= 1
+    # '-ing' after a vowel is its own syllable (being, going)
+    if _VOWEL_ING_RE.search(word):
+        count += 1
+    return max(1, count)
+
+
+def _flesch_reading_ease(text: str) -> float:
+    """Uncached Flesch Reading Ease behind calculate_readability."""
+    words = _PUNCTUATION_RE.sub("", text).lower().split()
+    if not words:
         return 0.0
 
+    sentences = _SENTENCE_RE.findall(text)
+    short = sum(
+        1
+        for sentence in sentences
+        if len(_PUNCTUATION_RE.sub("", sentence).split()) <= 2
+    )
+    sentence_count = max(1, len(sentences) - short)
+    syllable_count = sum(map(_count_syllables, words))
+
+    words_per_sentence = len(words) / sentence_count
+    syllables_per_word = syllable_count / len(words)
+    return 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+
 
 def calculate_unified_score(scores: dict) -> int:
     """
@@ -1036,101 +1312,217 @@ def check_page_title(html: str) -> str | None:
     DEPRECATED: Use as part of corporate page checks.
     Checks if the page title contains excluded keywords.
     """
-    soup = BeautifulSoup(html, "lxml")
-    if not soup.title or not soup.title.string:
+    match = _TITLE_RE.search(html)
+    title = unescape(match.group(1)) if match else None
+    if not title:
         return None
 
-    title = soup.title.string
-    # No need to lowercase for regex as we can use re.IGNORECASE flag if needed,
-    # but let's stick to standard practice. Pattern is likely case-insensitive intent.
-    # Actually, user wants robust matching. I'll use re.IGNORECASE.
-
-    for pattern in config.EXCLUDED_TITLE_PATTERNS:
-        if re.search(pattern, title, re.IGNORECASE):
-            return "Title matched common phrase"
+    # EXCLUDED_TITLE_RE is compiled with re.IGNORECASE
+    if config.EXCLUDED_TITLE_RE.search(title) is not None:
+        return "Title matched common phrase"
     return None
 
 
+# Recent evaluation results keyed by URL and content hashes, so re-crawls and
+# refilter runs over unchanged pages skip the parse and every scoring pass.
+_QUALITY_CACHE_SIZE = 4096
+_quality_cache: OrderedDict = OrderedDict()
+_quality_lock = threading.Lock()
+_quality_cache_hits = 0
+_quality_cache_misses = 0
+
+
+def _copy_result(result: dict) -> dict:
+    """Copy a cached result deep enough that callers can mutate it freely."""
+    return {
+        key: value.copy() if isinstance(value, (dict, list)) else value
+        for key, value in result.items()
+    }
+
+
+# Parse-bound features keyed by (len, hash) of the HTML alone, so the same
+# document served under several URLs (feed mirrors, tracking query strings)
+# is parsed once even though the URL-keyed result cache misses.
+_PAGE_FEATURES_CACHE_SIZE = 1024
+_page_features_cache: OrderedDict = OrderedDict()
+_page_features_lock = threading.Lock()
+
+
+def _page_features(html: str) -> tuple["PageSignals", float]:
+    """PageSignals and text ratio of a document, from one shared lxml parse."""
+    from provoke.utils.landing_page import extract_page_signals, parse_document
+
+    key = (len(html), hash(html))
+    with _page_features_lock:
+        if key in _page_features_cache:
+            _page_features_cache.move_to_end(key)
+            return _page_features_cache[key]
+
+    # Signals are read from the tree first; calculate_text_ratio strips it
+    tree = parse_document(html)
+    signals = extract_page_signals(html, tree=tree)
+    features = (signals, calculate_text_ratio(html, tree=tree))
+    with _page_features_lock:
+        _page_features_cache[key] = features
+        if len(_page_features_cache) > _PAGE_FEATURES_CACHE_SIZE:
+            _page_features_cache.popitem(last=False)
+    return features
+
+
+def quality_cache_info() -> dict:
+    """Hit/miss counters and size of the evaluate_page_quality result cache."""
+    with _quality_lock:
+        return {
+            "hits": _quality_cache_hits,
+            "misses": _quality_cache_misses,
+            "size": len(_quality_cache),
+            "maxsize": _QUALITY_CACHE_SIZE,
+        }
+
+
+def clear_quality_cache():
+    """Drop cached evaluations (e.g. after changing thresholds or the model)."""
+    global _quality_cache_hits, _quality_cache_misses
+    with _quality_lock:
+        _quality_cache.clear()
+        _quality_cache_hits = 0
+        _quality_cache_misses = 0
+    with _page_features_lock:
+        _page_features_cache.clear()
+
+
 def evaluate_page_quality(
     url: str,
     html: str,
     text: str,
-    whitelist: set | list | None = None,
+    whitelist: frozenset | set | list | None = None,
     force_ml: bool = False,
 ) -> dict:
-    """Combines all checks and return structured result."""
-    from urllib.parse import urlparse
-    from provoke.utils.landing_page import (
-        is_service_landing_page,
-        is_ecommerce_page,
-        is_homepage_not_article,
-        detect_spam_services,
-    )
+    """
+    Combines all checks and return structured result.
+    A frozenset whitelist is taken as already lowercased; build it once and
+    reuse it across calls.
+    """
+    global _quality_cache_hits, _quality_cache_misses
 
     # Check whitelist first (exact domain match, no subdomains)
+    # The URL is parsed once here; the path is shared with the helpers below.
     is_whitelisted = False
     parsed_url = urlparse(url)
+    url_path = parsed_url.path
     current_domain = parsed_url.netloc.lower()
 
     if whitelist:
         # User defined whitelist as domains. Check for exact match.
-        if current_domain in [d.lower() for d in whitelist]:
-            is_whitelisted = True
+        if not isinstance(whitelist, frozenset):
+            whitelist = frozenset(d.lower() for d in whitelist)
+        is_whitelisted = current_domain in whitelist
+
+    # The whitelist only matters through is_whitelisted, so that is what we key on
+    key = (url, len(html), hash(html), hash(text), is_whitelisted, force_ml)
+    with _quality_lock:
+        if key in _quality_cache:
+            _quality_cache.move_to_end(key)
+            _quality_cache_hits += 1
+            return _copy_result(_quality_cache[key])
+        _quality_cache_misses += 1
+
+    result = _evaluate_page_quality(url, html, text, url_path, is_whitelisted)
+    with _quality_lock:
+        _quality_cache[key] = _copy_result(result)
+        if len(_quality_cache) > _QUALITY_CACHE_SIZE:
+            _quality_cache.popitem(last=False)
+    return result
+
+
+def _evaluate_page_quality(
+    url: str, html: str, text: str, url_path: str, is_whitelisted: bool
+) -> dict:
+    """Uncached body of evaluate_page_quality."""
+    from provoke.utils.landing_page import is_homepage_not_article
 
     # PHASE 0: URL Pattern Hard Rejection
-    for pattern in config.EXCLUDED_URL_PATTERNS:
-        if re.search(pattern, url, re.IGNORECASE):
-            return {
-                "is_acceptable": False,
-                "rejection_reasons": ["URL matches excluded pattern"],
-                "scores": {"excluded_pattern": True},
-                "quality_tier": "rejected",
-            }
+    if config.EXCLUDED_URL_RE.search(url) is not None:
+        return {
+            "is_acceptable": False,
+            "rejection_reasons": ["URL matches excluded pattern"],
+            "scores": {"excluded_pattern": True},
+            "quality_tier": "rejected",
+        }
 
     # PHASE 0.5: Root Landing Page check
     # Many homepages are just landing pages, not content.
     if not is_whitelisted:
-        if is_homepage_not_article(url, html):
+        if is_homepage_not_article(url_path, html):
             return {
                 "is_acceptable": False,
                 "rejection_reasons": ["Root domain / landing page (not an article)"],
                 "quality_tier": "rejected",
             }
 
+    # Parse once (or not at all for a document already seen under another
+    # URL); one walk collects every tag-level signal used below
+    signals, text_ratio = _page_features(html)
+
+    # Lowercase once as well (skipping the copy when there is nothing to fold)
+    html_lower = html if html.islower() else html.lower()
+    text_lower = text if text.islower() else text.lower()
+
     # PHASE 0.6: Ad Script Blacklist (Hard Rejection)
     if not is_whitelisted:
         from provoke.utils.adblock import get_ad_blocker
 
         ad_blocker = get_ad_blocker()
-        soup = BeautifulSoup(html, "lxml")
         ad_scripts_found = []
 
-        # Check src in scripts and link tags
-        for tag in soup.find_all(["script", "link", "iframe"], src=True):
-            src = str(tag.get("src", "")).lower()
+        # Check src in scripts, link and iframe tags
+        for _tag, src in signals.srcs:
             if ad_blocker.is_ad_url(src):
                 ad_scripts_found.append(src)
 
         # Also check href in scripts/links
-        for tag in soup.find_all(["script", "link"], href=True):
-            href = str(tag.get("href", "")).lower()
-            if ad_blocker.is_ad_url(href):
+        for tag, href in signals.hrefs:
+            if tag in ("script", "link") and ad_blocker.is_ad_url(href):
                 ad_scripts_found.append(href)
 
-        if len(set(ad_scripts_found)) >= 2:
+        ad_count = len(set(ad_scripts_found))
+        if ad_count >= 2:
             return {
                 "is_acceptable": False,
                 "rejection_reasons": ["High density of blacklisted ad scripts found"],
                 "scores": {
                     "ad_script_blacklist": True,
-                    "ad_count": len(set(ad_scripts_found)),
+                    "ad_count": ad_count,
                 },
                 "quality_tier": "rejected",
             }
 
+    # PHASE 0.7: Too short to be an article (Hard Rejection)
+    # Skips corporate/ad scoring, readability and the ML model for obvious rejects
+    word_count = len(text.split())
+    if not is_whitelisted and word_count < config.THRESHOLDS["min_words"] // 2:
+        rejection_reasons = [f"Content length too short ({word_count} words)"]
+        if text_ratio < config.THRESHOLDS["min_text_ratio"]:
+            rejection_reasons.append(f"Text-to-HTML ratio too low ({text_ratio:.2f})")
+        return {
+            "is_acceptable": False,
+            "rejection_reasons": rejection_reasons,
+            "scores": {"word_count": word_count, "text_ratio": text_ratio},
+            "quality_tier": "rejected",
+        }
+
     # PHASE 1: COMPREHENSIVE SCORE PRE-FILTER
     # Calculate scores early to decide on hard rejection
-    corp_score = calculate_corporate_score(url, html, text)
+    corp_score = calculate_corporate_score(
+        url,
+        html,
+        text,
+        signals=signals,
+        html_lower=html_lower,
+        text_lower=text_lower,
+        url_path=url_path,
+        word_count=word_count,
+    )
 
     if not is_whitelisted:
         # Only reject if overwhelmingly corporate (score > 90)
@@ -1145,11 +1537,11 @@ def evaluate_page_quality(
 
     # PHASE 2: Continue with existing quality checks
 
-    text_ratio = calculate_text_ratio(html)
-    word_count = len(text.split())
     readability = calculate_readability(text)
 
-    ad_score, ad_tech_count = calculate_ad_score(html)
+    ad_score, ad_tech_count = calculate_ad_score(
+        html, signals=signals, html_lower=html_lower
+    )
     scores = {
         "text_ratio": text_ratio,
         "word_count": word_count,
@@ -1188,8 +1580,7 @@ def evaluate_page_quality(
                 classifier = get_classifier(config.ML_CONFIG["model_path"])
                 if classifier:
                     # Extract title for ML
-                    soup = BeautifulSoup(html, "lxml")
-                    page_title = soup.title.get_text(strip=True) if soup.title else ""
+                    page_title = signals.title
 
                     ml_accept, ml_reason, ml_confidence = classifier.is_acceptable(
                         text,
@@ -1,6 +1,7 @@
 import asyncio
 import aiohttp
-from bs4 import BeautifulSoup
+import re
+from bs4 import BeautifulSoup, SoupStrainer
 from playwright.async_api import async_playwright
 import sqlite3
 import time
@@ -8,17 +9,28 @@ import os
 import sys
 from urllib.parse import urljoin, urlparse
 import json
+import logging
 from provoke.config import config, evaluate_page_quality
 from provoke.utils.logger import QualityLogger
-import re
 from datetime import datetime
 from dataclasses import dataclass, field
+from functools import lru_cache
 import signal
 import hashlib
 import redis.asyncio as aredis
 from provoke.utils.robots import RobotsParser
 from provoke.utils.bloom import RedisBloomFilter
 
+# ASCII case-insensitive tag probes, so the dynamic-rendering heuristics can
+# scan raw HTML without allocating a lowercased copy of the whole document.
+_SCRIPT_OPEN_RE = re.compile(r"<script", re.IGNORECASE | re.ASCII)
+_NOSCRIPT_OPEN_RE = re.compile(r"<noscript", re.IGNORECASE | re.ASCII)
+
+# A URL is parsed several times on its way through the crawler (validation,
+# normalization, branch key, dynamic check, rejection tracking). ParseResult is
+# an immutable tuple, so the results can be shared.
+_cached_urlparse = lru_cache(maxsize=4096)(urlparse)
+
 
 @dataclass
 class BranchStats:
@@ -256,11 +268,12 @@ class AsyncCrawler:
             conn = self._get_db_connection()
             cursor = conn.cursor()
             cursor.execute("SELECT domain FROM whitelisted_domains")
-            domains = {row[0] for row in cursor.fetchall()}
+            # Lowercased frozenset: evaluate_page_quality uses it as-is
+            domains = frozenset(row[0].lower() for row in cursor.fetchall())
             conn.close()
             return domains
         except sqlite3.Error:
-            return set()
+            return frozenset()
 
     def add_to_blacklist(self, domain: str):
         """Add a domain to the blacklist in the database and in-memory cache."""
@@ -401,7 +414,7 @@ class AsyncCrawler:
 
     def normalize_url(self, url):
         # Strip fragment and query parameters for canonical URL
-        parsed = urlparse(url)
+        parsed = _cached_urlparse(url)
         return f"{parsed.scheme}://{parsed.netloc}{parsed.path}".rstrip("/")
 
     def get_branch_key(self, url, depth=0):
@@ -410,7 +423,7 @@ class AsyncCrawler:
         At depth 0, this is the seed URL (base domain/path).
         At deeper depths, we group URLs by their parent path structure.
         """
-        parsed = urlparse(url)
+        parsed = _cached_urlparse(url)
         path_parts = parsed.path.strip("/").split("/")
 
         if depth == 0:
@@ -447,18 +460,17 @@ class AsyncCrawler:
 
     def is_valid_url(self, url):
         normalized = self.normalize_url(url)
-        parsed = urlparse(url)
+        parsed = _cached_urlparse(url)
         domain = parsed.netloc.lower()
         path = parsed.path.lower()
         # Allow other domains, but still require a netloc and ensure not already visited/blacklisted
         # Also reject binary extensions listed in config (except PDF)
-        if any(path.endswith(ext) for ext in config.BINARY_EXTENSIONS):
+        if config.BINARY_EXT_RE.search(path):
             return False
 
         # Reject based on URL patterns (tags, categories, etc.)
-        for pattern in config.EXCLUDED_URL_PATTERNS:
-            if re.search(pattern, url, re.IGNORECASE):
-                return False
+        if config.EXCLUDED_URL_RE.search(url):
+            return False
 
         # Check if domain or any of its parent domains are blacklisted
         parts = domain.split(".")
@@ -476,7 +488,7 @@ class AsyncCrawler:
 
     def is_likely_dynamic(self, url: str, html: str | None = None) -> bool:
         """Check if URL requires dynamic rendering via heuristics."""
-        parsed = urlparse(url)
+        parsed = _cached_urlparse(url)
         domain = parsed.netloc.lower()
 
         # 1. Domain-level check
@@ -493,20 +505,19 @@ class AsyncCrawler:
 
             # Threshold-based detection from auto-switch feature
             thresholds = config.THRESHOLDS
-            html_lower = html.lower()
 
             # Logic 1: Size-based. If static content is unusually small, it's likely an SPA shell.
             if len(html) < thresholds.get("min_static_content_bytes", 1000):
                 return True
 
             # Logic 2: Script-density. High script count often indicates a complex app.
-            if html_lower.count("<script") > thresholds.get(
+            if len(_SCRIPT_OPEN_RE.findall(html)) > thresholds.get(
                 "max_static_script_tags", 20
             ):
                 return True
 
             # Logic 3: Explicit <noscript> tag is a strong indicator of JS requirement.
-            if "<noscript" in html_lower:
+            if _NOSCRIPT_OPEN_RE.search(html):
                 return True
 
         return False
@@ -652,7 +663,7 @@ class AsyncCrawler:
                 # We need to update feed_only_domains and potentially blacklist
                 # This affects shared state (feed_only_domains), might need lock if strictly parallel,
                 # but dict operations are atomic in GIL, so it's mostly fine.
-                parsed = urlparse(url)
+                parsed = _cached_urlparse(url)
                 domain = parsed.netloc.lower()
                 self.feed_only_domains[domain] = (
                     self.feed_only_domains.get(domain, 0) + 1
@@ -705,7 +716,7 @@ class AsyncCrawler:
                     print(f"  ✗ Rejected {url}: {', '.join(reasons)}")
 
                     # Track rejections
-                    parsed = urlparse(url)
+                    parsed = _cached_urlparse(url)
                     domain = parsed.netloc.lower()
                     self.domain_rejections[domain] = (
                         self.domain_rejections.get(domain, 0) + 1
@@ -738,7 +749,9 @@ class AsyncCrawler:
                 pass
                 # Actually, extracting links is fast enough.
                 # But we need soup.
-                soup = BeautifulSoup(html, "lxml")
+                soup = BeautifulSoup(
+                    html, "lxml", parse_only=SoupStrainer("a", href=True)
+                )
                 for link in soup.find_all("a", href=True):
                     href = str(link["href"])
                     next_url = urljoin(url, href)
@@ -957,6 +970,14 @@ def main():
 
     args = parser.parse_args()
 
+    # Records from the module loggers (robots, bloom, adblock) go to the log
+    # file, as before QualityLogger moved to its own non-propagating logger
+    logging.basicConfig(
+        filename=config.REJECTED_URLS_LOG,
+        level=logging.INFO,
+        format="%(asctime)s - %(message)s",
+    )
+
     # Override config thresholds with CLI arguments if provided
     if args.min_samples != 3:
         config.THRESHOLDS["branch_min_samples"] = args.min_samples
@@ -1010,6 +1031,7 @@ def main():
     finally:
         crawler.quality_logger.print_summary()
         crawler.print_branch_summary()
+        crawler.quality_logger.stop()
 
     if crawler.stop_requested:
         print("[CRAWL INTERRUPTED - Graceful shutdown completed]")
@@ -4,9 +4,9 @@ import sqlite3
 import redis
 import redis.asyncio as aredis
 from datetime import datetime
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 from provoke.config import config
+from provoke.utils.feeds import find_alternate_links, join_url
 
 
 class IndexerWorker:
@@ -154,26 +154,19 @@ class IndexerWorker:
             return
 
         try:
-            soup = BeautifulSoup(html, "lxml")
             domain = urlparse(url).netloc
             feeds_to_add = []
 
-            for link in soup.find_all("link", rel="alternate"):
-                link_type = link.get("type", "")
-                if isinstance(link_type, list):
-                    link_type = " ".join(link_type)
-                link_type = (link_type or "").lower()
+            for link in find_alternate_links(html):
+                link_type = link.get("type", "").lower()
 
                 href = link.get("href", "")
-                if isinstance(href, list):
-                    href = href[0]
-
                 if not href:
                     continue
 
-                full_url = urljoin(url, href)
+                full_url = join_url(url, href)
                 is_rss_type = link_type == "application/rss+xml"
-                ends_with_xml = full_url.lower().endswith(".xml")
+                ends_with_xml = full_url[-4:].lower() == ".xml"
 
                 if is_rss_type or ends_with_xml:
                     feeds_to_add.append(
@@ -207,25 +200,28 @@ class IndexerWorker:
                     """
                 )
 
-                for feed in feeds_to_add:
-                    try:
-                        cursor.execute(
-                            """
-                            INSERT OR IGNORE INTO rss_feeds
-                            (url, discovered_from, title, feed_type, source_domain, date_added)
-                            VALUES (?, ?, ?, ?, ?, ?)
-                            """,
+                date_added = datetime.now().isoformat()
+                try:
+                    cursor.executemany(
+                        """
+                        INSERT OR IGNORE INTO rss_feeds
+                        (url, discovered_from, title, feed_type, source_domain, date_added)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        """,
+                        (
                             (
                                 feed["url"],
                                 url,
                                 feed["title"],
                                 feed["type"],
                                 feed["domain"],
-                                datetime.now().isoformat(),
-                            ),
-                        )
-                    except sqlite3.Error:
-                        pass
+                                date_added,
+                            )
+                            for feed in feeds_to_add
+                        ),
+                    )
+                except sqlite3.Error:
+                    pass
 
                 conn.commit()
                 conn.close()
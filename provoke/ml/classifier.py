@@ -176,6 +176,44 @@ class ContentClassifier:
         Returns:
             (label, confidence) where label is 'good', 'bad', or 'uncertain'
         """
+        input_text = self._model_input(text, url, title)
+        if not input_text:
+            return "bad", 1.0
+
+        # Predict
+        labels, confidences = self.model.predict(input_text)
+        return self._label_from_prediction(labels, confidences, threshold)
+
+    def predict_batch(
+        self,
+        texts: list[str],
+        urls: list[str],
+        titles: list[str],
+        threshold: float = 0.7,
+    ) -> list[tuple[str, float]]:
+        """
+        Batched predict(): one FastText call for all non-empty inputs instead
+        of one call per page. Returns a (label, confidence) per input.
+        """
+        inputs = [
+            self._model_input(text, url, title)
+            for text, url, title in zip(texts, urls, titles)
+        ]
+        results: list[tuple[str, float]] = [("bad", 1.0)] * len(inputs)
+        indices = [i for i, input_text in enumerate(inputs) if input_text]
+        if not indices:
+            return results
+
+        all_labels, all_confidences = self.model.predict([inputs[i] for i in indices])
+        for i, labels, confidences in zip(indices, all_labels, all_confidences):
+            # Batched probabilities come back as float32; match predict()'s float64
+            confidences = np.asarray(confidences, dtype=np.float64)
+            results[i] = self._label_from_prediction(labels, confidences, threshold)
+        return results
+
+    @staticmethod
+    def _model_input(text: str, url: str, title: str) -> str:
+        """Build the single-line model input: url=<url> title=<title> <content>."""
         # Prepare input text with features if available
         clean_text = " ".join(text.split())
         input_text = clean_text
@@ -192,12 +230,11 @@ class ContentClassifier:
             parts.append(clean_text)
             input_text = " ".join(parts)
 
-        if not input_text:
-            return "bad", 1.0
-
-        # Predict
-        labels, confidences = self.model.predict(input_text)
+        return input_text
 
+    @staticmethod
+    def _label_from_prediction(labels, confidences, threshold: float) -> tuple[str, float]:
+        """Turn FastText's top label/probability into (label, confidence)."""
         # Add checks for empty labels and confidences
         if not labels or len(labels) == 0 or not confidences or len(confidences) == 0:
             return "uncertain", 0.0
@@ -279,7 +316,35 @@ class ContentClassifier:
         """
         # 1. Get raw ML prediction (threshold=0 to get raw result)
         ml_label, ml_confidence = self.predict(text, url, title, threshold=0.0)
+        return self._decide(text, url, title, ml_label, ml_confidence, high_threshold)
+
+    def is_acceptable_batch(
+        self,
+        texts: list[str],
+        urls: list[str],
+        titles: list[str],
+        high_threshold: float = 0.7,
+        low_threshold: float = 0.3,
+    ) -> list[tuple[bool, str, float]]:
+        """is_acceptable() for many pages, sharing one batched model call."""
+        predictions = self.predict_batch(texts, urls, titles, threshold=0.0)
+        return [
+            self._decide(text, url, title, ml_label, ml_confidence, high_threshold)
+            for text, url, title, (ml_label, ml_confidence) in zip(
+                texts, urls, titles, predictions
+            )
+        ]
 
+    def _decide(
+        self,
+        text: str,
+        url: str,
+        title: str,
+        ml_label: str,
+        ml_confidence: float,
+        high_threshold: float,
+    ) -> tuple[bool, str, float]:
+        """Rule checks and final accept/reject for one raw ML prediction."""
         # 2. Apply enhanced checks
         label, confidence, check_reason = self.enhanced_check(
             url, title, text, ml_label, ml_confidence
@@ -6,18 +6,12 @@ Usage:
     uv run python -m provoke.ml.trainer --export     # Export pages for labeling
     uv run python -m provoke.ml.trainer --train      # Train model after labeling
     uv run python -m provoke.ml.trainer --evaluate   # Evaluate model
+    uv run python -m provoke.ml.trainer --quantize   # Shrink the final model
 """
 
 import argparse
 import os
 from provoke.config import config
-from provoke.ml.data_prep import (
-    export_indexed_pages,
-    create_fasttext_training_file,
-    split_training_data,
-    augment_from_rejected_urls,
-)
-from provoke.ml.training import train_fasttext_model, evaluate_model
 
 
 def main():
@@ -27,6 +21,11 @@ def main():
     )
     parser.add_argument("--train", action="store_true", help="Train model")
     parser.add_argument("--evaluate", action="store_true", help="Evaluate model")
+    parser.add_argument(
+        "--quantize",
+        action="store_true",
+        help="Quantize the trained model (slow; run once on the final model)",
+    )
     parser.add_argument(
         "--limit", type=int, default=config.ML_EXPORT_LIMIT, help="Limit for export"
     )
@@ -38,12 +37,21 @@ def main():
 
     model_path = config.ML_CONFIG["model_path"]
 
+    # The training stack (fasttext, numpy) is only imported by the commands
+    # that use it, so --export starts without loading it
     if args.export:
+        from provoke.ml.data_prep import (
+            export_indexed_pages,
+            augment_from_rejected_urls,
+        )
+
         print(f"Exporting data for labeling (Total Limit: {args.limit})...")
 
         # 1. Clear existing to_label.csv if it exists to start fresh
-        if os.path.exists(config.LABEL_CSV):
+        try:
             os.remove(config.LABEL_CSV)
+        except FileNotFoundError:
+            pass
 
         # 2. Export indexed pages (potential good/bad mix from DB)
         # We'll take 40% from DB and 60% from rejected logs for a balanced mix
@@ -63,6 +71,12 @@ def main():
         print("3. Run: uv run python -m provoke.ml.trainer --train")
 
     elif args.train:
+        from provoke.ml.data_prep import (
+            create_fasttext_training_file,
+            split_training_data,
+        )
+        from provoke.ml.training import train_fasttext_model, evaluate_model
+
         print("Preparing training data...")
         create_fasttext_training_file(config.LABEL_CSV, config.TRAINING_DATA_FILE)
 
@@ -80,6 +94,8 @@ def main():
             lr=config.ML_LEARNING_RATE,
             epoch=config.ML_EPOCHS,
             wordNgrams=config.ML_WORD_NGRAMS,
+            loss=config.ML_LOSS,
+            thread=config.ML_THREADS,
         )
 
         if model:
@@ -88,8 +104,18 @@ def main():
             print(f"\nTraining complete! Model saved to {model_path}")
 
     elif args.evaluate:
+        from provoke.ml.training import evaluate_model
+
         print("Evaluating model...")
         evaluate_model(model_path, config.TEST_SPLIT_FILE)
+
+    elif args.quantize:
+        from provoke.ml.training import quantize_model, evaluate_model
+
+        model = quantize_model(model_path, config.TRAIN_SPLIT_FILE)
+        if model:
+            print("\nEvaluating quantized model on test set...")
+            evaluate_model(model_path, config.TEST_SPLIT_FILE)
     else:
         parser.print_help()
 
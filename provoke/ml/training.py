@@ -25,6 +25,9 @@ def train_fasttext_model(
     epoch: int | None = None,
     wordNgrams: int | None = None,
     dim: int | None = None,
+    loss: str | None = None,
+    thread: int | None = None,
+    quantize: bool | None = None,
     verbose: int | None = None,
 ):
     """Train FastText supervised classifier."""
@@ -32,6 +35,9 @@ def train_fasttext_model(
     epoch = epoch if epoch is not None else config.ML_EPOCHS
     wordNgrams = wordNgrams if wordNgrams is not None else config.ML_WORD_NGRAMS
     dim = dim if dim is not None else config.ML_EMBEDDING_DIM
+    loss = loss if loss is not None else config.ML_LOSS
+    thread = thread if thread is not None else config.ML_THREADS
+    quantize = quantize if quantize is not None else config.ML_QUANTIZE
     verbose = verbose if verbose is not None else config.ML_VERBOSE
 
     if not os.path.exists(train_file):
@@ -48,10 +54,14 @@ def train_fasttext_model(
         epoch=epoch,  # Training epochs
         wordNgrams=wordNgrams,  # Use bigrams (2) for better context
         dim=dim,  # Embedding dimension
-        loss="softmax",  # Classification loss
+        loss=loss,  # Classification loss
+        thread=thread,  # Parallel SGD workers
         verbose=verbose,
     )
 
+    if quantize:
+        _quantize(model, train_file, verbose)
+
     # Save model
     model.save_model(model_path)
     print(f"Model saved to {model_path}")
@@ -59,6 +69,40 @@ def train_fasttext_model(
     return model
 
 
+def _quantize(model, train_file: str, verbose: int):
+    # Compresses the embeddings with product quantization and retrains the
+    # classifier layer on the pruned vocabulary. fasttext.load_model()
+    # detects quantized files itself, so the path stays the same.
+    print("Quantizing model...")
+    model.quantize(
+        input=train_file,
+        qnorm=True,
+        retrain=True,
+        cutoff=config.ML_QUANTIZE_CUTOFF,
+        verbose=verbose,
+    )
+
+
+def quantize_model(model_path: str, train_file: str, verbose: int | None = None):
+    """
+    Product-quantize an already trained model in place. This is much slower
+    than training, so it is meant to run once on the final model.
+    """
+    verbose = verbose if verbose is not None else config.ML_VERBOSE
+
+    for path in (model_path, train_file):
+        if not os.path.exists(path):
+            print(f"Error: {path} not found.")
+            return None
+
+    model = fasttext.load_model(model_path)
+    _quantize(model, train_file, verbose)
+    model.save_model(model_path)
+    print(f"Quantized model saved to {model_path}")
+
+    return model
+
+
 def evaluate_model(model_path: str, test_file: str):
     """Evaluate FastText model on test set."""
 
@@ -75,7 +75,7 @@ def _cleanup_generator(check_all=False):
         blacklist = {row[0].lower() for row in cursor.fetchall()}
 
         cursor.execute("SELECT domain FROM whitelisted_domains")
-        whitelist = {row[0].lower() for row in cursor.fetchall()}
+        whitelist = frozenset(row[0].lower() for row in cursor.fetchall())
     except sqlite3.OperationalError:
         yield "Error: Required management tables not found."
         conn.close()
@@ -0,0 +1,42 @@
+import sqlite3
+
+
+def connect(db_path: str, **kwargs) -> sqlite3.Connection:
+    """
+    Open the database tuned for bulk scans and inserts by offline scripts.
+    Extra keyword arguments are passed to sqlite3.connect.
+    """
+    conn = sqlite3.connect(db_path, **kwargs)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    # Let large pages.html scans read through mmap instead of read() calls
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-65536")
+    return conn
+
+
+def executemany_or_each(
+    conn: sqlite3.Connection, sql: str, rows: list, on_error=None
+) -> int:
+    """
+    Run sql for every row in one transaction and return the number of rows
+    changed. If the batch fails it is rolled back and retried one row at a
+    time, so a bad row only loses itself; on_error(row, exc) is called for
+    each row that still fails.
+    """
+    try:
+        with conn:
+            return conn.executemany(sql, rows).rowcount
+    except sqlite3.Error:
+        pass
+
+    changed = 0
+    with conn:
+        for row in rows:
+            try:
+                changed += conn.execute(sql, row).rowcount
+            except sqlite3.Error as e:
+                if on_error is not None:
+                    on_error(row, e)
+    return changed
@@ -0,0 +1,103 @@
+import re
+from functools import lru_cache
+from html import unescape
+from urllib.parse import urljoin, urlsplit
+
+# Inside a tag, a quote only opens a value straight after "=" (and optional
+# spaces); anywhere else it is an ordinary character, as in
+# title=don't. Quoted values may contain ">", and an unclosed one runs to the
+# end of the document. Every character has exactly one way to match, so the
+# scan stays linear on malformed markup.
+_TAG_BODY = r"""(?:[^>"'=]|(?<=[^\s=])["']|=\s*"[^"]*(?:"|\Z)|=\s*'[^']*(?:'|\Z)|=)*"""
+
+# Elements whose content lxml keeps as raw text, not markup; <plaintext>
+# runs to the end of the document
+_RAW_TEXT_TAGS = (
+    "script",
+    "style",
+    "title",
+    "textarea",
+    "xmp",
+    "iframe",
+    "noembed",
+    "noframes",
+)
+
+# One scan over the raw HTML. Comments, raw-text elements and every other tag
+# are matched (and skipped) so "<link" text inside them isn't mistaken for a
+# tag, the same as an HTML parser would treat it. Like lxml, "<!" and "<?"
+# constructs other than comments (doctype, <![CDATA[, <?php) end at the
+# first ">".
+_LINK_SCAN_RE = re.compile(
+    r"<!--(?:-?>|.*?(?:--!?>|\Z))"
+    r"|<[!?][^>]*(?:>|\Z)"
+    rf"|<(?P<raw>{'|'.join(_RAW_TEXT_TAGS)})\b.*?(?:</(?P=raw)\b[^>]*>|\Z)"
+    r"|<plaintext\b.*"
+    rf"|<link(?=[\s/>])(?P<attrs>{_TAG_BODY})>"
+    rf"|<[a-z]{_TAG_BODY}(?:>|\Z)",
+    re.IGNORECASE | re.DOTALL,
+)
+_ATTR_RE = re.compile(
+    r"([^\s\"'>/=][^\s\"'>/=]*)(?:\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s>]+)))?"
+)
+
+
+def _parse_attrs(attr_text: str) -> dict[str, str]:
+    attrs = {}
+    for name, double, single, bare in _ATTR_RE.findall(attr_text):
+        name = name.lower()
+        # Like an HTML parser, the first occurrence of an attribute wins
+        if name not in attrs:
+            attrs[name] = unescape(double or single or bare)
+    return attrs
+
+
+def find_alternate_links(html: str) -> list[dict[str, str]]:
+    """
+    Attributes of every <link rel="alternate"> tag in the page, in document
+    order, without building a DOM. Names are lowercased and values have
+    character references decoded, matching what lxml's element.get() returns.
+    Like lxml, "<link" inside comments, raw-text elements (<script>, <title>,
+    <textarea>, ...) and <![CDATA[ sections is not a tag.
+    """
+    # rel tokens are ASCII case-insensitive, so rel="Alternate" counts too;
+    # lowering a copy is cheaper than an IGNORECASE search
+    if not html or "alternate" not in html.lower():
+        return []
+
+    links = []
+    for match in _LINK_SCAN_RE.finditer(html):
+        attr_text = match.group("attrs")
+        if attr_text is None or "alternate" not in attr_text.lower():
+            continue
+        attrs = _parse_attrs(attr_text)
+        # rel is a space-separated token list, e.g. "alternate feed"
+        if "alternate" in attrs.get("rel", "").lower().split():
+            links.append(attrs)
+    return links
+
+
+# hrefs that urljoin would return unchanged (absolute) or simply append to
+# the base's scheme and host (root-relative): printable ASCII without the
+# ?#; delimiters, brackets or whitespace, all of which urljoin may normalize
+# or reject. Paths also must not contain "//" or dot segments, which urljoin
+# collapses.
+_PLAIN_URL_CHARS = r"[!\"$-:<->@-Z\\^-~]"
+_PLAIN_ABSOLUTE_RE = re.compile(rf"https?://(?!/){_PLAIN_URL_CHARS}+\Z")
+_PLAIN_PATH_RE = re.compile(rf"/(?!/){_PLAIN_URL_CHARS}*\Z")
+
+_cached_urlsplit = lru_cache(maxsize=1024)(urlsplit)
+
+
+def join_url(base_url: str, href: str) -> str:
+    """
+    Same result as urljoin(base_url, href), with a fast path for the absolute
+    and root-relative hrefs that make up nearly all feed links.
+    """
+    if _PLAIN_ABSOLUTE_RE.match(href):
+        return href
+    if _PLAIN_PATH_RE.match(href) and "//" not in href and "/." not in href:
+        base = _cached_urlsplit(base_url)
+        if base.scheme in ("http", "https") and base.netloc:
+            return f"{base.scheme}://{base.netloc}{href}"
+    return urljoin(base_url, href)
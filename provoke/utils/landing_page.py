@@ -1,39 +1,224 @@
 import re
+from dataclasses import dataclass, field
 from urllib.parse import urlparse
-from bs4 import BeautifulSoup
-
-
-def count_buttons_with_text(html: str, keywords: list[str]) -> int:
-    """Count buttons/links containing specific keywords."""
-    soup = BeautifulSoup(html, "lxml")
+from lxml import etree
+from lxml import html as lxml_html
+
+
+# Keyword tables are static (and already lowercase), so build them once at import.
+SERVICE_CTA_KEYWORDS = (
+    "buy",
+    "purchase",
+    "order now",
+    "get started",
+    "sign up",
+    "try free",
+    "free trial",
+    "download",
+    "subscribe",
+    "add to cart",
+    "shop now",
+    "buy now",
+)
+
+_SOCIAL_SPAM = (
+    "buy followers",
+    "buy likes",
+    "buy subscribers",
+    "buy views",
+    "cheap followers",
+    "real followers",
+    "instagram followers",
+    "tiktok followers",
+    "youtube subscribers",
+    "boost your engagement",
+    "increase followers",
+    "grow your audience fast",
+)
+
+_SEO_TOOLS = (
+    "paraphrase",
+    "paraphrasing tool",
+    "rewrite text",
+    "article rewriter",
+    "spin text",
+    "humanize text",
+    "humanize ai",
+    "undetectable ai",
+    "bypass ai detector",
+    "plagiarism checker",
+    "seo tool",
+)
+
+SPAM_KEYWORDS = _SOCIAL_SPAM + _SEO_TOOLS
+# Spaces removed for the URL check
+SPAM_URL_KEYWORDS = tuple(keyword.replace(" ", "") for keyword in SPAM_KEYWORDS)
+
+
+# Tags whose attributes/text feed the quality checks (see extract_page_signals)
+_SIGNAL_TAGS = ("title", "script", "link", "iframe", "a", "button")
+_SRC_TAGS = ("script", "link", "iframe")
+
+
+def parse_document(html: str | bytes, encoding: str | None = None):
+    """
+    Parse a full HTML document with lxml; returns None when there is nothing
+    to parse. Raw bytes may be passed with the charset from the HTTP headers.
+    """
+    try:
+        if isinstance(html, bytes):
+            parser = lxml_html.HTMLParser(encoding=encoding) if encoding else None
+            return lxml_html.document_fromstring(html, parser=parser)
+        try:
+            return lxml_html.document_fromstring(html)
+        except ValueError:
+            # str input carrying an XML encoding declaration; hand lxml bytes.
+            # Parsers are not shared between threads, so build one per call.
+            return lxml_html.document_fromstring(
+                html.encode("utf-8"), parser=lxml_html.HTMLParser(encoding="utf-8")
+            )
+    except (etree.ParserError, LookupError):
+        return None
+
+
+@dataclass
+class PageSignals:
+    """Tag-level facts the quality checks need, gathered in a single walk."""
+
+    title: str = ""
+    # (tag, lowercased src) for script/link/iframe elements with a src
+    srcs: list[tuple[str, str]] = field(default_factory=list)
+    # (tag, lowercased href) for script/link/iframe/a elements with an href
+    hrefs: list[tuple[str, str]] = field(default_factory=list)
+    iframe_count: int = 0
+    # Lowercased text of every <button> and <a>, in document order
+    button_texts: list[str] = field(default_factory=list)
+
+
+def _element_text(elem) -> str:
+    """Same result as bs4's get_text(strip=True): stripped strings, no separator."""
+    return "".join(t.strip() for t in elem.itertext())
+
+
+def extract_page_signals(
+    html: str | bytes, encoding: str | None = None, tree=None
+) -> PageSignals:
+    """
+    Parse the page with lxml and collect PageSignals in one pass over the
+    tags of interest, replacing separate BeautifulSoup parses and find_all
+    walks. Raw bytes may be passed with the charset from the HTTP headers.
+    A tree already built by parse_document() may be passed to skip the parse;
+    it is only read, never modified.
+    """
+    signals = PageSignals()
+    if tree is None:
+        tree = parse_document(html, encoding)
+    if tree is None:
+        return signals
+
+    title_seen = False
+    for elem in tree.iter(_SIGNAL_TAGS):
+        tag = elem.tag
+        if tag == "title":
+            if not title_seen:
+                signals.title = _element_text(elem)
+                title_seen = True
+            continue
+
+        if tag in _SRC_TAGS:
+            src = elem.get("src")
+            if src is not None:
+                signals.srcs.append((tag, src.lower()))
+        if tag != "button":
+            href = elem.get("href")
+            if href is not None:
+                signals.hrefs.append((tag, href.lower()))
+        if tag == "iframe":
+            signals.iframe_count += 1
+        elif tag in ("a", "button"):
+            signals.button_texts.append(_element_text(elem).lower())
+
+    return signals
+
+
+# Absolute URLs fast_url_path can split by hand: urlparse strips/removes
+# whitespace and control characters and splits ";params" off the path.
+_PLAIN_URL_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*://[^\x00-\x20;]*\Z")
+
+
+def fast_url_path(url: str) -> str:
+    """
+    Return the path component of an absolute URL without urlparse.
+    Equivalent to urlparse(url).path; URLs outside the plain
+    "scheme://netloc/path" shape (no scheme, ";params", whitespace or control
+    characters) fall back to urlparse.
+    """
+    if _PLAIN_URL_RE.match(url) is None:
+        return urlparse(url).path
+
+    scheme_end = url.find("://")
+    netloc_start = scheme_end + 3
+    end = len(url)
+    for sep in ("?", "#"):
+        idx = url.find(sep, netloc_start, end)
+        if idx != -1:
+            end = idx
+
+    path_start = url.find("/", netloc_start, end)
+    if path_start == -1:
+        return ""
+    return url[path_start:end]
+
+
+def count_buttons_with_text(
+    html: str | bytes,
+    keywords: list[str],
+    encoding: str | None = None,
+    signals: PageSignals | None = None,
+    limit: int | None = None,
+) -> int:
+    """
+    Count buttons/links containing specific keywords.
+    Raw response bytes may be passed together with the charset from the HTTP
+    Content-Type header; this skips encoding detection.
+    PageSignals already extracted for the same page may be passed to skip parsing.
+    Scanning stops once `limit` keywords (or every keyword) have been found.
+    """
+    if signals is None:
+        signals = extract_page_signals(html, encoding)
 
-    # Find all buttons and links
-    elements = soup.find_all(["button", "a"])
+    # Lowercase the keywords once rather than per element
+    keywords_lc = [(keyword, keyword.lower()) for keyword in keywords]
+    if limit is None or limit > len(keywords_lc):
+        limit = len(keywords_lc)
 
     count = 0
     seen_keywords = set()
 
-    for elem in elements:
-        text = elem.get_text(strip=True).lower()
-        for keyword in keywords:
-            if keyword.lower() in text and keyword not in seen_keywords:
+    for text in signals.button_texts:
+        for keyword, keyword_lc in keywords_lc:
+            if keyword_lc in text and keyword not in seen_keywords:
                 count += 1
                 seen_keywords.add(keyword)
                 break
+        if count >= limit:
+            break
 
     return count
 
 
 def extract_internal_links(html: str) -> list[str]:
     """Extract all internal link paths from HTML."""
-    soup = BeautifulSoup(html, "lxml")
-    links = []
+    try:
+        tree = lxml_html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return []
 
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
-        # Handle potential list return (though rare for href)
-        if isinstance(href, list):
-            href = href[0]
+    links = []
+    for a in tree.iter("a"):
+        href = a.get("href")
+        if not href:
+            continue
 
         # Filter for internal links (relative or same domain)
         if href.startswith("/") or not href.startswith("http"):
@@ -42,29 +227,27 @@ def extract_internal_links(html: str) -> list[str]:
     return links
 
 
+def _score_from_counts(
+    cta_count: int, pricing_indicators: int, unique_service_phrases: int, is_root: bool
+) -> int:
+    """Turn the signal counts gathered by is_service_landing_page into a score."""
+    score = min(cta_count * 2, 10)  # CTA buttons (0-10 points)
+    if pricing_indicators >= 2:
+        score += 3  # Pricing indicators (0-3 points)
+    score += min(unique_service_phrases * 2, 6)  # Service language (0-6 points)
+    if is_root:
+        score += 2  # Root domain (0-2 points)
+    return score
+
+
 def is_service_landing_page(html: str, text: str, url_path: str) -> tuple[bool, int]:
     """
     Detect pages that are selling a service or product.
     Returns (True, score) if score > 8.
     """
-    score = 0
     text_lower = text.lower()
 
     # CTA Button Detection (0-10 points)
-    cta_keywords = [
-        "buy",
-        "purchase",
-        "order now",
-        "get started",
-        "sign up",
-        "try free",
-        "free trial",
-        "download",
-        "subscribe",
-        "add to cart",
-        "shop now",
-        "buy now",
-    ]
     # We use the helper function but we need to count unique types found
     # The helper function 'count_buttons_with_text' already counts unique keywords found (based on the set logic).
     # Wait, the prompt says "Award 2 points per unique CTA type found".
@@ -72,10 +255,10 @@ def is_service_landing_page(html: str, text: str, url_path: str) -> tuple[bool,
     # checks if keyword in text, adds to seen_keywords, increments count.
     # So it returns number of unique keywords found.
 
-    cta_count = count_buttons_with_text(html, cta_keywords)
-    score += min(cta_count * 2, 10)
+    # The CTA score saturates at 5 keywords, so stop counting there
+    cta_count = count_buttons_with_text(html, SERVICE_CTA_KEYWORDS, limit=5)
 
-    # Pricing Indicators (0-3 points)
+    # Pricing Indicators
     pricing_indicators = 0
     currency_symbols = ["$", "€", "£", "¥"]
     pricing_phrases = [
@@ -95,10 +278,7 @@ def is_service_landing_page(html: str, text: str, url_path: str) -> tuple[bool,
         if phrase in text_lower:
             pricing_indicators += 1
 
-    if pricing_indicators >= 2:
-        score += 3
-
-    # Service Description Language (0-6 points)
+    # Service Description Language
     service_phrases = [
         "we offer",
         "our service",
@@ -117,22 +297,20 @@ def is_service_landing_page(html: str, text: str, url_path: str) -> tuple[bool,
         if phrase in text_lower:
             unique_service_phrases += 1
 
-    score += min(unique_service_phrases * 2, 6)
-
-    # Root Domain Check (0-2 points)
+    # Root Domain Check
     normalized_path = url_path.strip().lower()
-    if (
-        normalized_path in ["/", "/index", "/index.html", "/home", ""]
-        or normalized_path == "/"
-    ):
-        score += 2
+    is_root = normalized_path in ["/", "/index", "/index.html", "/home", ""]
 
+    score = _score_from_counts(
+        cta_count, pricing_indicators, unique_service_phrases, is_root
+    )
     return score > 8, score
 
 
-def is_ecommerce_page(html: str) -> bool:
+def is_ecommerce_page(html: str, html_lower: str | None = None) -> bool:
     """Detect online shopping and product pages."""
-    html_lower = html.lower()
+    if html_lower is None:
+        html_lower = html.lower()
 
     # Shopping Cart Indicators
     cart_phrases = [
@@ -180,11 +358,15 @@ def is_ecommerce_page(html: str) -> bool:
     return False
 
 
-def is_homepage_not_article(url: str, html: str) -> bool:
-    """Detect homepages that don't lead to blog content."""
+def is_homepage_not_article(url_path: str, html: str) -> bool:
+    """
+    Detect homepages that don't lead to blog content.
+    Takes the already-parsed URL path (e.g. urlparse(url).path) so callers
+    can parse once and share it with is_service_landing_page.
+    """
 
-    # 1. Parse URL path
-    path = urlparse(url).path.strip("/")
+    # 1. Normalize URL path
+    path = url_path.strip("/")
 
     # 2. Check if root domain
     root_paths = ["", "index", "index.html", "home", "index.php"]
@@ -220,53 +402,21 @@ def is_homepage_not_article(url: str, html: str) -> bool:
         return True  # Homepage without blog content
 
 
-def detect_spam_services(url: str, text: str) -> bool:
+def detect_spam_services(url: str, text: str, text_lower: str | None = None) -> bool:
     """Detect spam/manipulation services and low-value tools."""
 
-    social_spam = [
-        "buy followers",
-        "buy likes",
-        "buy subscribers",
-        "buy views",
-        "cheap followers",
-        "real followers",
-        "instagram followers",
-        "tiktok followers",
-        "youtube subscribers",
-        "boost your engagement",
-        "increase followers",
-        "grow your audience fast",
-    ]
-
-    seo_tools = [
-        "paraphrase",
-        "paraphrasing tool",
-        "rewrite text",
-        "article rewriter",
-        "spin text",
-        "humanize text",
-        "humanize ai",
-        "undetectable ai",
-        "bypass ai detector",
-        "plagiarism checker",
-        "seo tool",
-    ]
-
-    all_keywords = social_spam + seo_tools
-
     # 1. Check URL
     url_lower = url.lower()
-    for keyword in all_keywords:
-        # Remove spaces for URL check
-        keyword_no_space = keyword.replace(" ", "")
+    for keyword_no_space in SPAM_URL_KEYWORDS:
         if keyword_no_space in url_lower:
             return True
 
     # 2. Check Text Content
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
     unique_keywords_found = 0
 
-    for keyword in all_keywords:
+    for keyword in SPAM_KEYWORDS:
         if keyword in text_lower:
             unique_keywords_found += 1
 
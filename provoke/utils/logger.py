@@ -1,9 +1,66 @@
 import csv
 import os
+import queue
 import logging
+import logging.handlers
+import threading
+import time
+import weakref
+from collections import Counter
 from datetime import datetime
 from provoke.config import config
 
+CSV_BUFFER_SIZE = 64 * 1024
+CSV_FLUSH_EVERY = 50  # Rejection rows buffered before hitting the disk
+
+# Accept/reject lines go to a dedicated logger rather than the root logger, so
+# other loggers' handlers never see them and they are written exactly once.
+# Every QualityLogger shares one queue handler and one background listener
+# thread; the listener stops when the last instance is stopped.
+_quality_log = logging.getLogger("provoke.quality")
+_quality_log.setLevel(logging.INFO)
+_quality_log.propagate = False
+_listener = None
+_listener_users = 0
+_listener_lock = threading.Lock()
+
+
+def _acquire_listener(log_file):
+    """Start the shared listener writing to log_file, unless already running."""
+    global _listener, _listener_users
+    with _listener_lock:
+        if _listener is None:
+            file_handler = logging.FileHandler(log_file)
+            file_handler.setFormatter(
+                logging.Formatter("%(asctime)s - %(message)s")
+            )
+            log_queue = queue.Queue(-1)
+            _quality_log.addHandler(logging.handlers.QueueHandler(log_queue))
+            _listener = logging.handlers.QueueListener(log_queue, file_handler)
+            _listener.start()
+        _listener_users += 1
+
+
+def _release_listener():
+    """Drop one user of the shared listener, draining and closing it after the last."""
+    global _listener, _listener_users
+    with _listener_lock:
+        _listener_users -= 1
+        if _listener_users > 0 or _listener is None:
+            return
+        for handler in list(_quality_log.handlers):
+            _quality_log.removeHandler(handler)
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+def _close_logger(csv_fh):
+    """Shutdown shared by QualityLogger.stop() and its exit/GC finalizer."""
+    csv_fh.close()  # Writes out any buffered rows
+    _release_listener()
+
 
 class QualityLogger:
     def __init__(self, log_file=None, csv_file=None):
@@ -12,63 +69,97 @@ class QualityLogger:
         self.stats = {
             "accepted": 0,
             "rejected": 0,
-            "rejection_reasons": {},
-            "tiers": {"high": 0, "medium": 0, "low": 0},
+            "rejection_reasons": Counter(),
+            # Counter keeps the fixed tiers but tolerates unexpected ones ("unknown")
+            "tiers": Counter({"high": 0, "medium": 0, "low": 0}),
         }
 
-        # Setup basic logging
-        logging.basicConfig(
-            filename=self.log_file,
-            level=logging.INFO,
-            format="%(asctime)s - %(message)s",
-        )
+        # CSV timestamps are reformatted at most once per second
+        self._last_ts_sec = None
+        self._last_ts_str = ""
+
+        # Keep the stats CSV open and buffered; rows are flushed in batches
+        # rather than reopening the file for every rejection.
+        is_new_csv = not os.path.exists(self.csv_file)
+        self._csv_fh = open(self.csv_file, "a", newline="", buffering=CSV_BUFFER_SIZE)
+        self._csv_writer = csv.writer(self._csv_fh)
+        self._pending_rows = 0
+
+        # Initialize CSV header if the file didn't exist
+        if is_new_csv:
+            self._csv_writer.writerow(
+                [
+                    "url",
+                    "rejection_reasons",
+                    "corporate_score",
+                    "text_ratio",
+                    "word_count",
+                    "unified_score",
+                    "timestamp",
+                ]
+            )
+            self._csv_fh.flush()
+
+        # Setup non-blocking logging: callers only enqueue records, a single
+        # background listener thread drains them to the log file. While other
+        # instances are running, their listener (and log file) is reused.
+        _acquire_listener(self.log_file)
+
+        # Buffered rows are written and the listener released even when stop()
+        # is never called: at interpreter exit, or once the logger is collected.
+        self._finalizer = weakref.finalize(self, _close_logger, self._csv_fh)
+
+    def flush(self):
+        """Write any buffered CSV rows to disk."""
+        if self._csv_fh is not None and not self._csv_fh.closed:
+            self._csv_fh.flush()
+        self._pending_rows = 0
 
-        # Initialize CSV if it doesn't exist
-        if not os.path.exists(self.csv_file):
-            with open(self.csv_file, "w", newline="") as f:
-                writer = csv.writer(f)
-                writer.writerow(
-                    [
-                        "url",
-                        "rejection_reasons",
-                        "corporate_score",
-                        "text_ratio",
-                        "word_count",
-                        "unified_score",
-                        "timestamp",
-                    ]
-                )
+    def stop(self):
+        """Flush pending CSV rows and log records, then stop the background listener."""
+        self._finalizer()
+        self._csv_fh = None
+        self._pending_rows = 0
+
+    def _timestamp(self):
+        """Return an ISO timestamp, reusing the cached string within a second."""
+        now_sec = int(time.monotonic())
+        if now_sec != self._last_ts_sec:
+            self._last_ts_sec = now_sec
+            self._last_ts_str = datetime.now().isoformat(timespec="seconds")
+        return self._last_ts_str
 
     def log_rejection(self, url, reasons, scores):
         reason_str = ", ".join(reasons)
-        logging.info(f"REJECTED: {url} - Reasons: {reason_str}")
+        _quality_log.info(f"REJECTED: {url} - Reasons: {reason_str}")
 
         # Update stats
         self.stats["rejected"] += 1
-        for reason in reasons:
-            self.stats["rejection_reasons"][reason] = (
-                self.stats["rejection_reasons"].get(reason, 0) + 1
-            )
+        self.stats["rejection_reasons"].update(reasons)
 
-        # Log to CSV
-        with open(self.csv_file, "a", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(
-                [
-                    url,
-                    reason_str,
-                    scores.get("corporate_score", 0),
-                    round(scores.get("text_ratio", 0), 3),
-                    scores.get("word_count", 0),
-                    scores.get("unified_score", 0),
-                    datetime.now().isoformat(),
-                ]
-            )
+        # Log to CSV (buffered, flushed every CSV_FLUSH_EVERY rows); after
+        # stop() the file is closed and only the stats are kept
+        if self._csv_fh is None or self._csv_fh.closed:
+            return
+        self._csv_writer.writerow(
+            [
+                url,
+                reason_str,
+                scores.get("corporate_score", 0),
+                round(scores.get("text_ratio", 0), 3),
+                scores.get("word_count", 0),
+                scores.get("unified_score", 0),
+                self._timestamp(),
+            ]
+        )
+        self._pending_rows += 1
+        if self._pending_rows >= CSV_FLUSH_EVERY:
+            self.flush()
 
     def log_acceptance(self, url, tier):
         self.stats["accepted"] += 1
-        self.stats["tiers"][tier] = self.stats["tiers"].get(tier, 0) + 1
-        logging.info(f"ACCEPTED: {url} - Tier: {tier}")
+        self.stats["tiers"][tier] += 1
+        _quality_log.info(f"ACCEPTED: {url} - Tier: {tier}")
 
     def get_summary(self):
         summary = [
@@ -82,9 +173,7 @@ class QualityLogger:
             f"  Low: {self.stats['tiers']['low']}",
             "\nRejection Reasons:",
         ]
-        for reason, count in sorted(
-            self.stats["rejection_reasons"].items(), key=lambda x: x[1], reverse=True
-        ):
+        for reason, count in self.stats["rejection_reasons"].most_common():
             summary.append(f"  - {reason}: {count}")
         summary.append("----------------------------\n")
         return "\n".join(summary)
@@ -96,8 +185,6 @@ class QualityLogger:
         """Print summary of rejections by category."""
         print("\n=== Rejection Summary ===")
         # Use simple mapping for category names if needed, but here we can just use the keys
-        for category, count in sorted(
-            self.stats["rejection_reasons"].items(), key=lambda x: x[1], reverse=True
-        ):
+        for category, count in self.stats["rejection_reasons"].most_common():
             if count > 0:
                 print(f"{category}: {count}")
@@ -1,9 +1,14 @@
+import heapq
 import sqlite3
 import os
 
 from provoke.ml.classifier import ContentClassifier
 from provoke.config import config
 
+# Only the most confident bad URLs are printed; keep a bounded heap of them
+# instead of collecting and sorting every bad row.
+MAX_BAD_URLS = 1000
+
 
 def main():
     db_path = config.DATABASE_PATH
@@ -73,7 +78,9 @@ def main():
                 stats["low_conf_good"] += 1
         elif label == "bad":
             stats["bad"] += 1
-            bad_urls.append((url, confidence))
+            heapq.heappush(bad_urls, (confidence, url))
+            if len(bad_urls) > MAX_BAD_URLS:
+                heapq.heappop(bad_urls)
             if confidence >= confidence_threshold:
                 stats["high_conf_bad"] += 1
             else:
@@ -113,10 +120,9 @@ def main():
     print(f"Low Confidence BAD: {stats['low_conf_bad']}")
 
     if bad_urls:
-        print("\n--- Bad URLs ---")
+        print(f"\n--- Bad URLs (top {len(bad_urls)} by confidence) ---")
         # Sort by confidence (highest first)
-        bad_urls.sort(key=lambda x: x[1], reverse=True)
-        for url, confidence in bad_urls:
+        for confidence, url in sorted(bad_urls, reverse=True):
             print(f"[{confidence:.2f}] {url}")
 
 
@@ -14,6 +14,12 @@ from provoke.config import config
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
 TEMPLATE_DIR = os.path.join(PROJECT_ROOT, "templates")
 
+# Strips the "(value)" detail from reasons like "Text-to-HTML ratio too low (0.02)"
+_REASON_DETAIL_RE = re.compile(r"\s*\(.*?\)")
+
+# Values that mark a row of the labeling CSV as labeled
+_LABEL_VALUES = frozenset(("good", "bad", "unsure"))
+
 app = Flask(__name__, template_folder=TEMPLATE_DIR)
 engine = SearchEngine()
 
@@ -146,7 +152,7 @@ def get_admin_data():
                 reasons_raw = row.get("rejection_reasons", "")
                 if reasons_raw:
                     for r in [r.strip() for r in reasons_raw.split(",")]:
-                        normalized_r = re.sub(r"\s*\(.*?\)", "", r)
+                        normalized_r = _REASON_DETAIL_RE.sub("", r)
                         if normalized_r in [
                             "Weak personal blog identity signals",
                             "Has blog schema",
@@ -186,24 +192,33 @@ def get_admin_data():
     pending_labels = 0
     if os.path.exists(config.LABEL_CSV):
         with open(config.LABEL_CSV, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Skip corrupted rows
-                if None in row:
-                    continue
-                if not all(k in row for k in ["url", "title", "snippet", "quality"]):
-                    continue
-
-                q = (row.get("quality") or "").strip().lower()
-
-                # Skip rows with corrupted quality field
-                if len(q) > 50:
-                    continue
-
-                if q in ["good", "bad", "unsure"]:
-                    done_labels += 1
-                else:
-                    pending_labels += 1
+            # Plain csv.reader: this is only a counting pass, no need for a
+            # dict per row
+            reader = csv.reader(f)
+            header = next(reader, None) or []
+            columns = {name: i for i, name in enumerate(header)}
+            # A file missing any of the label columns has no usable rows
+            if all(k in columns for k in ["url", "title", "snippet", "quality"]):
+                quality_idx = columns["quality"]
+                for row in reader:
+                    # Blank lines aren't rows
+                    if not row:
+                        continue
+                    # Skip corrupted rows (more fields than the header)
+                    if len(row) > len(header):
+                        continue
+
+                    q = row[quality_idx] if quality_idx < len(row) else ""
+                    q = q.strip().lower()
+
+                    # Skip rows with corrupted quality field
+                    if len(q) > 50:
+                        continue
+
+                    if q in _LABEL_VALUES:
+                        done_labels += 1
+                    else:
+                        pending_labels += 1
 
     return {
         "total_pages": total_pages,
@@ -343,7 +358,11 @@ def test_url():
 
         # Evaluate
         result = evaluate_page_quality(
-            url, html, text, whitelist=whitelisted, force_ml=True
+            url,
+            html,
+            text,
+            whitelist=frozenset(d.lower() for d in whitelisted),
+            force_ml=True,
         )
 
         return jsonify(
@@ -644,7 +663,7 @@ def label_ui():
                 continue
 
             # Found an unlabeled item
-            if q not in ["good", "bad", "unsure"]:
+            if q not in _LABEL_VALUES:
                 unlabeled_item = row
                 break
 
@@ -696,7 +715,7 @@ def api_label():
     next_item = None
     for row in rows:
         q = (row.get("quality") or "").strip().lower()
-        if q not in ["good", "bad", "unsure"]:
+        if q not in _LABEL_VALUES:
             next_item = row
             break
 
@@ -17,10 +17,13 @@ Usage:
 """
 
 import argparse
+import asyncio
+import json
 import sqlite3
 import sys
+import threading
 import warnings
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlparse
@@ -28,14 +31,67 @@ from urllib.parse import urlparse
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-import requests
+import aiohttp
 from bs4 import BeautifulSoup
+from lxml import etree
 
 from provoke.config import config
+from provoke.utils.db import connect
 from provoke.ml.classifier import get_classifier
 
 warnings.filterwarnings("ignore")
 
+# One DB connection per worker thread, reused for every page it saves.
+# Every thread's {db_path: connection} dict is also registered so
+# close_db_connections can close them once the workers are done.
+_thread_local = threading.local()
+_thread_conns: list[dict] = []
+_thread_conns_lock = threading.Lock()
+
+# Pages per FastText predict call
+CLASSIFY_BATCH_SIZE = 64
+
+
+def get_db_connection(db_path: str) -> sqlite3.Connection:
+    """Return this thread's connection to db_path, opening it on first use."""
+    conns = getattr(_thread_local, "conns", None)
+    if conns is None:
+        conns = _thread_local.conns = {}
+        with _thread_conns_lock:
+            _thread_conns.append(conns)
+    conn = conns.get(db_path)
+    if conn is None:
+        # Closed from the main thread by close_db_connections
+        conn = connect(db_path, check_same_thread=False)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT UNIQUE,
+                title TEXT,
+                content TEXT,
+                html TEXT,
+                quality_score TEXT,
+                quality_tier TEXT
+            )
+            """
+        )
+        conn.commit()
+        conns[db_path] = conn
+    return conn
+
+
+def close_db_connections():
+    """
+    Close every connection opened by get_db_connection. Call once no thread
+    is using them; threads open a fresh connection on their next call.
+    """
+    with _thread_conns_lock:
+        for conns in _thread_conns:
+            for conn in conns.values():
+                conn.close()
+            conns.clear()
+
 
 def get_rss_feeds_from_db(db_path: str, active_only: bool = True) -> list:
     """Get RSS feed URLs from the rss_feeds table."""
@@ -75,164 +131,238 @@ def get_rss_feeds_from_db(db_path: str, active_only: bool = True) -> list:
     ]
 
 
-def parse_rss_feed(feed_url: str) -> list:
+# Feed elements are matched by local name, so namespaced feeds (RSS 1.0/RDF,
+# Atom) and prefixed tags such as <atom:link> are found like plain RSS tags.
+# string() yields "" when the element is missing, like an empty .text.
+_ITEM_XPATH = etree.XPath("//*[local-name()='item']")
+_ENTRY_XPATH = etree.XPath("//*[local-name()='entry']")
+_LINK_TEXT_XPATH = etree.XPath("string((.//*[local-name()='link'])[1])")
+_LINK_HREF_XPATH = etree.XPath("string((.//*[local-name()='link'])[1]/@href)")
+_TITLE_TEXT_XPATH = etree.XPath("string((.//*[local-name()='title'])[1])")
+
+
+def extract_feed_entries(content: bytes, feed_url: str) -> list:
+    """Extract entry URLs and titles from raw RSS/Atom feed bytes."""
+    if not content or content.isspace():
+        return []
+
+    # recover tolerates the malformed markup common in feeds; entities are not
+    # expanded and nothing is fetched over the network while parsing
+    parser = etree.XMLParser(recover=True, resolve_entities=False, no_network=True)
+    try:
+        root = etree.fromstring(content, parser)
+    except etree.XMLSyntaxError:
+        # Even recover mode gives up on undecodable or empty documents
+        return []
+    if root is None:
+        return []
+
+    entries = []
+
+    # Try RSS 2.0 format
+    items = _ITEM_XPATH(root)
+    for item in items:
+        link = _LINK_TEXT_XPATH(item)
+        if link:
+            entries.append({
+                "url": link.strip(),
+                "title": _TITLE_TEXT_XPATH(item).strip(),
+                "source_feed": feed_url,
+            })
+
+    # Try Atom format
+    if not items:
+        for entry in _ENTRY_XPATH(root):
+            href = _LINK_HREF_XPATH(entry)
+            if href:
+                entries.append({
+                    "url": href.strip(),
+                    "title": _TITLE_TEXT_XPATH(entry).strip(),
+                    "source_feed": feed_url,
+                })
+
+    return entries
+
+
+async def parse_rss_feed(session: aiohttp.ClientSession, feed_url: str) -> list:
     """Parse an RSS/Atom feed and return a list of entry URLs with metadata."""
     entries = []
     try:
-        response = requests.get(
-            feed_url,
-            timeout=config.HTTP_TIMEOUT,
-            headers={"User-Agent": config.USER_AGENT},
-        )
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.content, "xml")
-
-        # Try RSS 2.0 format
-        items = soup.find_all("item")
-        if items:
-            for item in items:
-                link = item.find("link")
-                title = item.find("title")
-                if link and link.text:
-                    entries.append({
-                        "url": link.text.strip(),
-                        "title": title.text.strip() if title else "",
-                        "source_feed": feed_url,
-                    })
-
-        # Try Atom format
-        if not items:
-            entries_tags = soup.find_all("entry")
-            for entry in entries_tags:
-                link = entry.find("link")
-                title = entry.find("title")
-                if link:
-                    href = link.get("href", "")
-                    if href:
-                        entries.append({
-                            "url": href.strip(),
-                            "title": title.text.strip() if title else "",
-                            "source_feed": feed_url,
-                        })
+        async with session.get(feed_url) as response:
+            response.raise_for_status()
+            content = await response.read()
 
+        entries = extract_feed_entries(content, feed_url)
     except Exception as e:
         print(f"Error parsing feed {feed_url}: {e}", file=sys.stderr)
 
     return entries
 
 
-def fetch_page(url: str) -> dict | None:
-    """Fetch a page and return its content."""
+async def fetch_page(session: aiohttp.ClientSession, url: str) -> str | None:
+    """Fetch a page and return its decoded HTML."""
+    max_bytes = config.THRESHOLDS.get("max_page_size_mb", 2) * 1024 * 1024
     try:
-        response = requests.get(
-            url,
-            timeout=config.HTTP_TIMEOUT,
-            headers={"User-Agent": config.USER_AGENT},
-        )
-        response.raise_for_status()
+        async with session.get(url) as response:
+            response.raise_for_status()
+
+            # Stream the (decompressed) body and drop pages over the crawler's
+            # size cap instead of buffering them whole
+            chunks = []
+            size = 0
+            async for chunk in response.content.iter_chunked(64 * 1024):
+                size += len(chunk)
+                if size > max_bytes:
+                    print(f"Skipping {url}: larger than {max_bytes} bytes", file=sys.stderr)
+                    return None
+                chunks.append(chunk)
+            encoding = response.charset or "utf-8"
+    except Exception as e:
+        print(f"Error fetching {url}: {e}", file=sys.stderr)
+        return None
 
-        soup = BeautifulSoup(response.text, "lxml")
+    content = b"".join(chunks)
+    try:
+        return content.decode(encoding, errors="replace")
+    except LookupError:
+        return content.decode("utf-8", errors="replace")
+
+
+def build_page_data(url: str, html: str) -> dict | None:
+    """Extract the title and visible text the classifier needs from a page."""
+    try:
+        soup = BeautifulSoup(html, "lxml")
         title = soup.title.string if soup.title else url
         text = soup.get_text(separator=" ", strip=True)
-
-        return {
-            "url": url,
-            "title": str(title),
-            "text": text,
-            "html": response.text,
-        }
     except Exception as e:
-        print(f"Error fetching {url}: {e}", file=sys.stderr)
+        print(f"Error parsing {url}: {e}", file=sys.stderr)
         return None
 
+    return {
+        "url": url,
+        "title": str(title),
+        "text": text,
+        "html": html,
+    }
+
 
-def ml_only_filter(page_data: dict, classifier) -> tuple[bool, str, float]:
+def ml_only_filter(pages: list, classifier) -> list[tuple[bool, str, float]]:
     """Run only the ML classifier, skip all other quality filters."""
-    is_acceptable, reason, confidence = classifier.is_acceptable(
-        text=page_data["text"],
-        url=page_data["url"],
-        title=page_data["title"],
+    return classifier.is_acceptable_batch(
+        texts=[page["text"] for page in pages],
+        urls=[page["url"] for page in pages],
+        titles=[page["title"] for page in pages],
     )
-    return is_acceptable, reason, confidence
 
 
-def save_page_to_db(db_path: str, page_data: dict, ml_reason: str, ml_confidence: float):
-    """Save a page to the database with ML classification info."""
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+def save_pages_to_db(db_path: str, accepted: list):
+    """
+    Save (page_data, ml_reason, ml_confidence) tuples to the database with
+    ML classification info, in one transaction.
+    """
+    conn = get_db_connection(db_path)
 
-    # Ensure table exists
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS pages (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            url TEXT UNIQUE,
-            title TEXT,
-            content TEXT,
-            html TEXT,
-            quality_score TEXT,
-            quality_tier TEXT
+    rows = []
+    for page_data, ml_reason, ml_confidence in accepted:
+        quality_score = {
+            "ml_reason": ml_reason,
+            "ml_confidence": ml_confidence,
+            "filter_type": "ml_only",
+        }
+        rows.append(
+            (
+                page_data["url"],
+                page_data["title"],
+                page_data["text"],
+                page_data["html"],
+                json.dumps(quality_score),
+                "ml_accepted",
+            )
         )
-        """
-    )
 
-    quality_score = {
-        "ml_reason": ml_reason,
-        "ml_confidence": ml_confidence,
-        "filter_type": "ml_only",
-    }
-
-    import json
-
-    cursor.execute(
+    conn.executemany(
         """
         INSERT OR REPLACE INTO pages (url, title, content, html, quality_score, quality_tier)
         VALUES (?, ?, ?, ?, ?, ?)
         """,
-        (
-            page_data["url"],
-            page_data["title"],
-            page_data["text"],
-            page_data["html"],
-            json.dumps(quality_score),
-            "ml_accepted",
-        ),
+        rows,
     )
     conn.commit()
-    conn.close()
 
 
-def process_entry(entry: dict, classifier, db_path: str, stats: dict):
-    """Process a single RSS entry: fetch and classify with ML only."""
+def get_indexed_urls(db_path: str, urls: list, batch_size: int = 500) -> set:
+    """Return the subset of urls already in the pages table, in a few queries."""
+    conn = get_db_connection(db_path)
+    indexed = set()
+    for i in range(0, len(urls), batch_size):
+        batch = urls[i : i + batch_size]
+        placeholders = ",".join("?" * len(batch))
+        rows = conn.execute(
+            f"SELECT url FROM pages WHERE url IN ({placeholders})", batch
+        ).fetchall()
+        indexed.update(row[0] for row in rows)
+    return indexed
+
+
+async def fetch_entry(
+    session: aiohttp.ClientSession,
+    sem: asyncio.Semaphore,
+    executor: ThreadPoolExecutor,
+    entry: dict,
+) -> dict | None:
+    """Fetch a single RSS entry and extract what the classifier needs."""
     url = entry["url"]
 
-    # Check if already in database
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute("SELECT 1 FROM pages WHERE url = ?", (url,))
-    if cursor.fetchone():
-        conn.close()
-        stats["skipped_already_indexed"] += 1
-        return
-    conn.close()
+    async with sem:
+        html = await fetch_page(session, url)
+    if html is None:
+        return None
 
-    # Fetch the page
-    page_data = fetch_page(url)
-    if not page_data:
-        stats["fetch_errors"] += 1
+    # Parsing is blocking; keep it off the loop
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, build_page_data, url, html)
+
+
+async def process_batch(
+    session: aiohttp.ClientSession,
+    sem: asyncio.Semaphore,
+    executor: ThreadPoolExecutor,
+    entries: list,
+    classifier,
+    db_path: str,
+    stats: dict,
+):
+    """Process a batch of RSS entries: fetch, then classify with ML only."""
+    loop = asyncio.get_running_loop()
+
+    # Fetch the pages
+    pages = await asyncio.gather(
+        *(fetch_entry(session, sem, executor, entry) for entry in entries)
+    )
+    pages = [page for page in pages if page]
+    stats["fetch_errors"] += len(entries) - len(pages)
+    if not pages:
         return
 
-    # Run ML-only classification
-    is_acceptable, reason, confidence = ml_only_filter(page_data, classifier)
+    # Run ML-only classification, one model call for the whole batch
+    results = await loop.run_in_executor(executor, ml_only_filter, pages, classifier)
 
-    if is_acceptable:
-        save_page_to_db(db_path, page_data, reason, confidence)
-        stats["accepted"] += 1
-        print(f"✓ ACCEPTED: {url} (confidence: {confidence:.2f})")
-    else:
-        stats["rejected"] += 1
-        print(f"✗ REJECTED: {url} (reason: {reason}, confidence: {confidence:.2f})")
+    accepted = [
+        (page, reason, confidence)
+        for page, (is_acceptable, reason, confidence) in zip(pages, results)
+        if is_acceptable
+    ]
+    if accepted:
+        await loop.run_in_executor(executor, save_pages_to_db, db_path, accepted)
+
+    for page, (is_acceptable, reason, confidence) in zip(pages, results):
+        url = page["url"]
+        if is_acceptable:
+            stats["accepted"] += 1
+            print(f"✓ ACCEPTED: {url} (confidence: {confidence:.2f})")
+        else:
+            stats["rejected"] += 1
+            print(f"✗ REJECTED: {url} (reason: {reason}, confidence: {confidence:.2f})")
 
 
 def update_feed_stats(db_path: str, feed_url: str, entry_count: int):
@@ -302,53 +432,10 @@ def main():
 
     print(f"Found {len(feed_urls)} RSS feeds to process", flush=True)
 
-    # Collect all entries from all feeds
-    all_entries = []
-    for feed in feed_urls:
-        feed_url = feed["url"]
-        print(f"Parsing feed: {feed_url}", flush=True)
-        entries = parse_rss_feed(feed_url)
-        print(f"  → {len(entries)} entries found", flush=True)
-        all_entries.extend(entries)
-        update_feed_stats(args.db, feed_url, len(entries))
-
-    # Remove duplicates by URL
-    seen_urls = set()
-    unique_entries = []
-    for entry in all_entries:
-        if entry["url"] not in seen_urls:
-            seen_urls.add(entry["url"])
-            unique_entries.append(entry)
-
-    print(f"\nTotal unique entries to process: {len(unique_entries)}", flush=True)
-
-    if args.limit:
-        unique_entries = unique_entries[: args.limit]
-        print(f"Limited to first {args.limit} entries", flush=True)
-
-    # Stats tracking
-    stats = {
-        "accepted": 0,
-        "rejected": 0,
-        "fetch_errors": 0,
-        "skipped_already_indexed": 0,
-    }
-
-    # Process entries with thread pool
-    print(f"\nProcessing with {args.max_workers} parallel workers...", flush=True)
-    print("=" * 60, flush=True)
-
-    with ThreadPoolExecutor(max_workers=args.max_workers) as executor:
-        futures = {
-            executor.submit(process_entry, entry, classifier, args.db, stats): entry
-            for entry in unique_entries
-        }
-
-        for future in as_completed(futures):
-            try:
-                future.result()
-            except Exception as e:
-                print(f"Error processing entry: {e}", file=sys.stderr)
+    try:
+        stats = asyncio.run(index_feeds(args, classifier, feed_urls))
+    finally:
+        close_db_connections()
 
     print("=" * 60, flush=True)
     print("\nSUMMARY:", flush=True)
@@ -359,5 +446,84 @@ def main():
     print(f"  Total processed:       {sum(stats.values())}", flush=True)
 
 
+async def index_feeds(args, classifier, feed_urls: list) -> dict:
+    """Fetch every feed, then fetch, classify and store their new entries."""
+    timeout = aiohttp.ClientTimeout(total=config.HTTP_TIMEOUT)
+    async with aiohttp.ClientSession(
+        headers={"User-Agent": config.USER_AGENT}, timeout=timeout
+    ) as session:
+        # At most --max-workers requests are in flight at any time
+        sem = asyncio.Semaphore(args.max_workers)
+
+        async def fetch_feed(feed_url):
+            async with sem:
+                return await parse_rss_feed(session, feed_url)
+
+        # Collect all entries from all feeds (fetched concurrently, reported in order)
+        feed_list = [feed["url"] for feed in feed_urls]
+        feed_entries = await asyncio.gather(*(fetch_feed(url) for url in feed_list))
+        all_entries = []
+        for feed_url, entries in zip(feed_list, feed_entries):
+            print(f"Parsing feed: {feed_url}", flush=True)
+            print(f"  → {len(entries)} entries found", flush=True)
+            all_entries.extend(entries)
+            update_feed_stats(args.db, feed_url, len(entries))
+
+        # Remove duplicates by URL
+        seen_urls = set()
+        unique_entries = []
+        for entry in all_entries:
+            if entry["url"] not in seen_urls:
+                seen_urls.add(entry["url"])
+                unique_entries.append(entry)
+
+        print(f"\nTotal unique entries to process: {len(unique_entries)}", flush=True)
+
+        if args.limit:
+            unique_entries = unique_entries[: args.limit]
+            print(f"Limited to first {args.limit} entries", flush=True)
+
+        # Stats tracking
+        stats = {
+            "accepted": 0,
+            "rejected": 0,
+            "fetch_errors": 0,
+            "skipped_already_indexed": 0,
+        }
+
+        # Drop entries that are already indexed before fetching anything
+        indexed = get_indexed_urls(args.db, [entry["url"] for entry in unique_entries])
+        if indexed:
+            stats["skipped_already_indexed"] = len(indexed)
+            unique_entries = [e for e in unique_entries if e["url"] not in indexed]
+
+        # Fetch concurrently on the event loop; CPU work goes to a small pool
+        print(f"\nProcessing with {args.max_workers} parallel workers...", flush=True)
+        print("=" * 60, flush=True)
+
+        # Batches run concurrently too; each is classified as soon as its
+        # pages are in, so one slow fetch only holds back its own batch
+        batches = [
+            unique_entries[i : i + CLASSIFY_BATCH_SIZE]
+            for i in range(0, len(unique_entries), CLASSIFY_BATCH_SIZE)
+        ]
+        with ThreadPoolExecutor(max_workers=args.max_workers) as executor:
+            results = await asyncio.gather(
+                *(
+                    process_batch(
+                        session, sem, executor, batch, classifier, args.db, stats
+                    )
+                    for batch in batches
+                ),
+                return_exceptions=True,
+            )
+
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"Error processing batch: {result}", file=sys.stderr)
+
+        return stats
+
+
 if __name__ == "__main__":
     main()
@@ -15,24 +15,35 @@ import sqlite3
 import sys
 import argparse
 import json
-import warnings
+import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from bs4 import BeautifulSoup
-from bs4 import XMLParsedAsHTMLWarning
 from provoke.config import config
+from provoke.utils.db import connect, executemany_or_each
+from provoke.utils.feeds import find_alternate_links, join_url
+from provoke.utils.landing_page import parse_document
 
-warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
+# Rows pulled from the pages cursor per round of work handed to the process
+# pool; bounds how much HTML is held in memory at once
+SCAN_BLOCK_SIZE = 1024
+# Pages sent to a worker process per task, to amortize pickling/IPC
+SCAN_CHUNK_SIZE = 32
+
+# Cheap substring test run before parsing: a sitemap link needs an href
+# containing "sitemap" (in any case), so pages without one can skip lxml
+# entirely. find_alternate_links does the same for feed links.
+_SITEMAP_MARKER_RE = re.compile("sitemap", re.IGNORECASE)
 
 
 def get_feeds_from_table(db_path: str, active_only: bool = True) -> list:
     """Get RSS feeds from the rss_feeds table."""
-    conn = sqlite3.connect(db_path)
+    conn = connect(db_path)
     cursor = conn.cursor()
 
     # Check if table exists
@@ -75,33 +86,36 @@ def get_feeds_from_table(db_path: str, active_only: bool = True) -> list:
     ]
 
 
-def extract_feeds_from_html(html: str, base_url: str) -> list:
-    """Extract RSS/Atom feed URLs from HTML content.
-
-    Only includes feeds with type 'application/rss+xml' or URLs ending with .xml
-    """
+def _parse_html(html: str):
+    """Parse page HTML for link discovery; None if it can't be parsed."""
     if not html:
-        return []
+        return None
+    try:
+        return parse_document(html)
+    except Exception:
+        return None
 
+
+def _feeds_from_links(links: list, base_url: str, seen: set) -> list:
     feeds = []
     try:
-        soup = BeautifulSoup(html, "lxml")
         domain = urlparse(base_url).netloc
 
-        for link in soup.find_all("link", rel="alternate"):
+        for link in links:
             link_type = link.get("type", "").lower()
             href = link.get("href", "")
 
             if not href:
                 continue
 
-            full_url = urljoin(base_url, href)
+            full_url = join_url(base_url, href)
 
             # Only include if type is application/rss+xml or URL ends with .xml
             is_rss_type = link_type == "application/rss+xml"
-            ends_with_xml = full_url.lower().endswith(".xml")
+            ends_with_xml = full_url[-4:].lower() == ".xml"
 
-            if is_rss_type or ends_with_xml:
+            if (is_rss_type or ends_with_xml) and full_url not in seen:
+                seen.add(full_url)
                 feeds.append({
                     "url": full_url,
                     "type": link.get("type", "unknown"),
@@ -116,12 +130,95 @@ def extract_feeds_from_html(html: str, base_url: str) -> list:
     return feeds
 
 
+def _sitemaps_from_tree(tree, base_url: str, seen: set) -> list:
+    sitemaps = []
+    try:
+        for a in tree.iter("a"):
+            href = a.get("href")
+            if href is None:
+                continue
+            href = href.lower()
+            if href.endswith(".xml") and "sitemap" in href:
+                full_url = join_url(base_url, href)
+                if full_url in seen:
+                    continue
+                seen.add(full_url)
+                sitemaps.append({
+                    "url": full_url,
+                    "source": "html_link",
+                    "context": "".join(t.strip() for t in a.itertext()),
+                })
+
+    except Exception:
+        pass
+
+    return sitemaps
+
+
+def extract_feeds_from_html(html: str, base_url: str, seen: set | None = None) -> list:
+    """Extract RSS/Atom feed URLs from HTML content.
+
+    Only includes feeds with type 'application/rss+xml' or URLs ending with .xml.
+    URLs already in seen (or repeated within the page) are skipped; seen is
+    updated with the ones returned.
+    """
+    if not html:
+        return []
+    if seen is None:
+        seen = set()
+    # <link> tags are simple enough to pull out without building a tree
+    return _feeds_from_links(find_alternate_links(html), base_url, seen)
+
+
+def extract_sitemaps_from_html(
+    html: str, base_url: str, seen: set | None = None
+) -> list:
+    """Extract sitemap references from HTML content. Only includes URLs ending with .xml.
+
+    URLs already in seen (or repeated within the page) are skipped; seen is
+    updated with the ones returned.
+    """
+    if not html or not _SITEMAP_MARKER_RE.search(html):
+        return []
+    tree = _parse_html(html)
+    if tree is None:
+        return []
+    if seen is None:
+        seen = set()
+    return _sitemaps_from_tree(tree, base_url, seen)
+
+
+def extract_feeds_and_sitemaps(
+    html: str,
+    base_url: str,
+    seen_feeds: set | None = None,
+    seen_sitemaps: set | None = None,
+) -> tuple:
+    """
+    Same as (extract_feeds_from_html(...), extract_sitemaps_from_html(...)),
+    in one call.
+    """
+    return (
+        extract_feeds_from_html(html, base_url, seen_feeds),
+        extract_sitemaps_from_html(html, base_url, seen_sitemaps),
+    )
+
+
+def _unique_by_url(items) -> list:
+    """Flatten per-page result lists, keeping the first entry for each URL."""
+    unique: dict[str, dict] = {}
+    for page_items in items:
+        for item in page_items:
+            unique.setdefault(item["url"], item)
+    return list(unique.values())
+
+
 def add_feeds_to_table(db_path: str, feeds: list) -> int:
     """Add discovered feeds to the rss_feeds table."""
     if not feeds:
         return 0
 
-    conn = sqlite3.connect(db_path)
+    conn = connect(db_path)
     cursor = conn.cursor()
 
     # Ensure table exists
@@ -142,135 +239,157 @@ def add_feeds_to_table(db_path: str, feeds: list) -> int:
         )
         """
     )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_rss_feeds_active_domain_url "
+        "ON rss_feeds(is_active, source_domain, url)"
+    )
 
+    # On a re-scan nearly every candidate is already known; one read of the
+    # url column lets those be dropped in memory, and skips the write
+    # transaction entirely when nothing is new
+    existing = {row[0] for row in cursor.execute("SELECT url FROM rss_feeds")}
+
+    date_added = datetime.now().isoformat()
+    rows = [
+        (
+            feed["url"],
+            feed.get("discovered_from", ""),
+            feed.get("title", ""),
+            feed.get("type", "unknown"),
+            feed.get("source_domain", ""),
+            date_added,
+        )
+        for feed in feeds
+        if feed["url"] not in existing
+    ]
+    if not rows:
+        conn.close()
+        return 0
+
+    # One transaction for the whole batch instead of a commit per row;
+    # rowcount sums over executemany and skips ignored duplicates. If the
+    # batch fails, rows are retried one by one and only the bad ones dropped.
     added_count = 0
-    for feed in feeds:
-        try:
-            cursor.execute(
-                """
-                INSERT OR IGNORE INTO rss_feeds
-                (url, discovered_from, title, feed_type, source_domain, date_added)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    feed["url"],
-                    feed.get("discovered_from", ""),
-                    feed.get("title", ""),
-                    feed.get("type", "unknown"),
-                    feed.get("source_domain", ""),
-                    datetime.now().isoformat(),
-                ),
-            )
-            if cursor.rowcount > 0:
-                added_count += 1
-        except sqlite3.Error:
-            pass
-
-    conn.commit()
+    try:
+        added_count = executemany_or_each(
+            conn,
+            """
+            INSERT INTO rss_feeds
+            (url, discovered_from, title, feed_type, source_domain, date_added)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(url) DO NOTHING
+            """,
+            rows,
+        )
+    except sqlite3.Error:
+        pass
+
     conn.close()
     return added_count
 
 
-def scan_pages_for_feeds(db_path: str) -> tuple:
-    """Scan all pages for RSS feeds and return (feeds_found, feeds_added)."""
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+def map_pages(db_path: str, func):
+    """
+    Yield func((url, html)) for every page with HTML, in table order.
 
+    Parsing is CPU-bound, so rows are spread over a process pool; they are
+    read from the cursor in blocks so memory stays bounded.
+    """
+    conn = connect(db_path)
+    cursor = conn.cursor()
     cursor.execute("SELECT url, html FROM pages WHERE html IS NOT NULL")
-    rows = cursor.fetchall()
-    conn.close()
 
-    all_feeds = []
-    for url, html in rows:
-        if html:
-            feeds = extract_feeds_from_html(html, url)
-            all_feeds.extend(feeds)
+    try:
+        with ProcessPoolExecutor(initializer=_reset_worker_seen) as executor:
+            while rows := cursor.fetchmany(SCAN_BLOCK_SIZE):
+                yield from executor.map(func, rows, chunksize=SCAN_CHUNK_SIZE)
+    finally:
+        conn.close()
 
-    # Remove duplicates by URL
-    seen = set()
-    unique_feeds = []
-    for feed in all_feeds:
-        if feed["url"] not in seen:
-            seen.add(feed["url"])
-            unique_feeds.append(feed)
 
-    added = add_feeds_to_table(db_path, unique_feeds)
-    return len(unique_feeds), added
+# URLs each pool worker has already returned during the current scan. Pages
+# of one site usually all link the same feed, so most repeats are dropped in
+# the worker instead of being sent back; results still arrive in page order,
+# so the first occurrence kept by _unique_by_url is unchanged.
+_worker_seen_feeds: set = set()
+_worker_seen_sitemaps: set = set()
 
 
-def extract_sitemaps_from_html(html: str, base_url: str) -> list:
-    """Extract sitemap references from HTML content. Only includes URLs ending with .xml."""
-    if not html:
-        return []
+def _reset_worker_seen():
+    _worker_seen_feeds.clear()
+    _worker_seen_sitemaps.clear()
 
-    sitemaps = []
-    try:
-        soup = BeautifulSoup(html, "lxml")
 
-        for a in soup.find_all("a", href=True):
-            href = a.get("href", "").lower()
-            if href.endswith(".xml") and "sitemap" in href:
-                full_url = urljoin(base_url, href)
-                sitemaps.append({
-                    "url": full_url,
-                    "source": "html_link",
-                    "context": a.get_text(strip=True) or ""
-                })
+def _extract_feeds_from_row(row: tuple) -> list:
+    url, html = row
+    return extract_feeds_from_html(html, url, _worker_seen_feeds)
 
-    except Exception:
-        pass
 
-    return sitemaps
+def _extract_sitemaps_from_row(row: tuple) -> list:
+    url, html = row
+    return extract_sitemaps_from_html(html, url, _worker_seen_sitemaps)
 
 
-def get_sitemaps_from_pages(db_path: str) -> list:
-    """Scan pages for sitemap references."""
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+def _extract_feeds_and_sitemaps_from_row(row: tuple) -> tuple:
+    url, html = row
+    return extract_feeds_and_sitemaps(
+        html, url, _worker_seen_feeds, _worker_seen_sitemaps
+    )
 
-    cursor.execute("SELECT url, html FROM pages WHERE html IS NOT NULL")
-    rows = cursor.fetchall()
-    conn.close()
 
-    all_sitemaps = []
-    seen = set()
+def scan_pages_for_feeds(db_path: str) -> tuple:
+    """Scan all pages for RSS feeds and return (feeds_found, feeds_added)."""
+    unique_feeds = _unique_by_url(map_pages(db_path, _extract_feeds_from_row))
+    added = add_feeds_to_table(db_path, unique_feeds)
+    return len(unique_feeds), added
+
+
+def get_sitemaps_from_pages(db_path: str) -> list:
+    """Scan pages for sitemap references."""
+    return _unique_by_url(map_pages(db_path, _extract_sitemaps_from_row))
 
-    for url, html in rows:
-        if not html:
-            continue
-        sitemaps = extract_sitemaps_from_html(html, url)
-        for sitemap in sitemaps:
-            if sitemap["url"] not in seen:
-                seen.add(sitemap["url"])
-                all_sitemaps.append(sitemap)
 
-    return all_sitemaps
+def scan_pages(db_path: str) -> tuple:
+    """
+    Scan all pages once for both RSS feeds and sitemaps.
+    Returns (unique_feeds, unique_sitemaps); feeds are not written to the table.
+    """
+    feed_lists = []
+    sitemap_lists = []
+    for feeds, sitemaps in map_pages(db_path, _extract_feeds_and_sitemaps_from_row):
+        feed_lists.append(feeds)
+        sitemap_lists.append(sitemaps)
+    return _unique_by_url(feed_lists), _unique_by_url(sitemap_lists)
 
 
 def get_stats(db_path: str) -> dict:
     """Get statistics about feeds and sitemaps."""
-    conn = sqlite3.connect(db_path)
+    conn = connect(db_path)
     cursor = conn.cursor()
 
-    # Check if rss_feeds table exists
-    cursor.execute(
-        "SELECT name FROM sqlite_master WHERE type='table' AND name='rss_feeds'"
-    )
-    has_table = cursor.fetchone() is not None
-
-    feed_count = 0
-    domain_count = 0
-    if has_table:
-        cursor.execute("SELECT COUNT(*) FROM rss_feeds WHERE is_active = 1")
-        feed_count = cursor.fetchone()[0]
+    # All counts in one statement; both feed counts come from the same pass
+    # over the (is_active, source_domain, url) index
+    try:
         cursor.execute(
-            "SELECT COUNT(DISTINCT source_domain) FROM rss_feeds WHERE is_active = 1"
+            """
+            SELECT
+                (SELECT COUNT(*) FROM pages),
+                feeds.feed_count,
+                feeds.domain_count
+            FROM (
+                SELECT COUNT(*) AS feed_count,
+                       COUNT(DISTINCT source_domain) AS domain_count
+                FROM rss_feeds WHERE is_active = 1
+            ) AS feeds
+            """
         )
-        domain_count = cursor.fetchone()[0]
-
-    # Count total pages
-    cursor.execute("SELECT COUNT(*) FROM pages")
-    page_count = cursor.fetchone()[0]
+        page_count, feed_count, domain_count = cursor.fetchone()
+    except sqlite3.OperationalError:
+        # No rss_feeds table yet
+        cursor.execute("SELECT COUNT(*) FROM pages")
+        page_count = cursor.fetchone()[0]
+        feed_count = 0
+        domain_count = 0
 
     conn.close()
 
@@ -357,14 +476,22 @@ def main():
     args = parser.parse_args()
 
     scan_info = None
+    sitemaps = []
     if args.scan:
         print("Scanning pages for RSS feeds...", file=sys.stderr)
-        found, added = scan_pages_for_feeds(args.db)
+        if args.feeds_only:
+            found, added = scan_pages_for_feeds(args.db)
+        else:
+            # One pass over the pages collects feeds and sitemaps together
+            found_feeds, sitemaps = scan_pages(args.db)
+            found = len(found_feeds)
+            added = add_feeds_to_table(args.db, found_feeds)
         scan_info = {"found": found, "added": added}
         print(f"Found {found} feeds, added {added} new ones to table.", file=sys.stderr)
+    elif not args.feeds_only:
+        sitemaps = get_sitemaps_from_pages(args.db)
 
     feeds = get_feeds_from_table(args.db, active_only=not args.all)
-    sitemaps = get_sitemaps_from_pages(args.db) if not args.feeds_only else []
     stats = get_stats(args.db)
 
     if args.sitemaps_only:
@@ -378,7 +505,9 @@ def main():
         }
         if scan_info:
             data["scan"] = scan_info
-        print(json.dumps(data, indent=2))
+        # Stream straight to stdout rather than building the whole string
+        json.dump(data, sys.stdout, indent=2)
+        sys.stdout.write("\n")
     else:
         print_text_output(feeds, sitemaps, stats, scan_info)
 
@@ -18,25 +18,40 @@ Usage:
 import argparse
 import sqlite3
 import sys
-import warnings
 from datetime import datetime
 from pathlib import Path
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from bs4 import BeautifulSoup
-from bs4 import XMLParsedAsHTMLWarning
-
 from provoke.config import config
+from provoke.utils.db import connect, executemany_or_each
+from provoke.utils.feeds import find_alternate_links, join_url
 
-warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
+
+# Secondary indexes on rss_feeds, by name. scan_and_migrate_feeds drops and
+# rebuilds them around large loads.
+_RSS_FEEDS_INDEXES = {
+    # Faster lookups
+    "idx_rss_feeds_domain": (
+        "CREATE INDEX IF NOT EXISTS idx_rss_feeds_domain ON rss_feeds(source_domain)"
+    ),
+    "idx_rss_feeds_active": (
+        "CREATE INDEX IF NOT EXISTS idx_rss_feeds_active ON rss_feeds(is_active)"
+    ),
+    # Covers the active-feed listing (WHERE is_active ORDER BY source_domain,
+    # url) so SQLite needs no temp B-tree for the sort
+    "idx_rss_feeds_active_domain_url": (
+        "CREATE INDEX IF NOT EXISTS idx_rss_feeds_active_domain_url "
+        "ON rss_feeds(is_active, source_domain, url)"
+    ),
+}
 
 
 def init_rss_feeds_table(db_path: str):
     """Create the rss_feeds table if it doesn't exist."""
-    conn = sqlite3.connect(db_path)
+    conn = connect(db_path)
     cursor = conn.cursor()
 
     cursor.execute(
@@ -57,13 +72,8 @@ def init_rss_feeds_table(db_path: str):
         """
     )
 
-    # Create index for faster lookups
-    cursor.execute(
-        "CREATE INDEX IF NOT EXISTS idx_rss_feeds_domain ON rss_feeds(source_domain)"
-    )
-    cursor.execute(
-        "CREATE INDEX IF NOT EXISTS idx_rss_feeds_active ON rss_feeds(is_active)"
-    )
+    for create_index in _RSS_FEEDS_INDEXES.values():
+        cursor.execute(create_index)
 
     conn.commit()
     conn.close()
@@ -77,11 +87,10 @@ def extract_feeds_from_html(html: str, base_url: str) -> list:
 
     feeds = []
     try:
-        soup = BeautifulSoup(html, "lxml")
         domain = urlparse(base_url).netloc
 
-        # Look for link elements with feed types
-        for link in soup.find_all("link", rel="alternate"):
+        # Look for <link rel="alternate"> elements with feed types
+        for link in find_alternate_links(html):
             link_type = link.get("type", "").lower()
             href = link.get("href", "")
 
@@ -90,10 +99,10 @@ def extract_feeds_from_html(html: str, base_url: str) -> list:
 
             # Only include if type is application/rss+xml or URL ends with .xml
             is_rss_type = link_type == "application/rss+xml"
-            ends_with_xml = href.lower().endswith(".xml")
+            ends_with_xml = href[-4:].lower() == ".xml"
 
             if is_rss_type or ends_with_xml:
-                full_url = urljoin(base_url, href)
+                full_url = join_url(base_url, href)
                 feeds.append({
                     "url": full_url,
                     "type": link.get("type", "unknown"),
@@ -108,48 +117,77 @@ def extract_feeds_from_html(html: str, base_url: str) -> list:
     return feeds
 
 
+def _report_insert_error(row: tuple, error: sqlite3.Error):
+    print(f"Error inserting feed {row[0]}: {error}", file=sys.stderr)
+
+
 def scan_and_migrate_feeds(db_path: str) -> int:
     """Scan all pages for RSS feeds and add them to the rss_feeds table."""
-    conn = sqlite3.connect(db_path)
+    conn = connect(db_path)
     cursor = conn.cursor()
 
     # Get all pages with HTML content
+    # Stream rows from the cursor instead of fetchall() so only one page's
+    # HTML is held in memory at a time
     cursor.execute("SELECT url, html FROM pages WHERE html IS NOT NULL")
-    rows = cursor.fetchall()
 
     all_feeds = []
-    for url, html in rows:
+    page_count = 0
+    for url, html in cursor:
+        page_count += 1
         if html:
             feeds = extract_feeds_from_html(html, url)
             all_feeds.extend(feeds)
 
-    print(f"Discovered {len(all_feeds)} potential RSS feeds from {len(rows)} pages")
-
-    # Insert unique feeds into rss_feeds table
+    print(f"Discovered {len(all_feeds)} potential RSS feeds from {page_count} pages")
+
+    # Loading more new feeds than the table already holds: building the
+    # secondary indexes once afterwards (a single sort each) beats updating
+    # them row by row. UNIQUE(url) stays, ON CONFLICT needs it. Small top-ups
+    # into a big table keep the indexes, as rebuilding would cost more than
+    # it saves. Every page of a site repeats its feeds, so only distinct URLs
+    # not yet in the table count.
+    existing = {row[0] for row in cursor.execute("SELECT url FROM rss_feeds")}
+    new_count = len({feed["url"] for feed in all_feeds} - existing)
+    rebuild_indexes = new_count > len(existing)
+    if rebuild_indexes:
+        for index_name in _RSS_FEEDS_INDEXES:
+            cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+    date_added = datetime.now().isoformat()
     added_count = 0
-    for feed in all_feeds:
-        try:
-            cursor.execute(
-                """
-                INSERT OR IGNORE INTO rss_feeds
-                (url, discovered_from, title, feed_type, source_domain, date_added)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
+    try:
+        # Insert unique feeds into rss_feeds table, in one transaction instead
+        # of a commit per row; rowcount sums over executemany and skips
+        # ignored duplicates. A failing row is logged and the rest still land.
+        added_count = executemany_or_each(
+            conn,
+            """
+            INSERT INTO rss_feeds
+            (url, discovered_from, title, feed_type, source_domain, date_added)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(url) DO NOTHING
+            """,
+            [
                 (
                     feed["url"],
                     feed["discovered_from"],
                     feed["title"],
                     feed["type"],
                     feed["source_domain"],
-                    datetime.now().isoformat(),
-                ),
-            )
-            if cursor.rowcount > 0:
-                added_count += 1
-        except sqlite3.Error as e:
-            print(f"Error inserting feed {feed['url']}: {e}", file=sys.stderr)
+                    date_added,
+                )
+                for feed in all_feeds
+            ],
+            on_error=_report_insert_error,
+        )
+    except sqlite3.Error as e:
+        print(f"Error inserting feeds: {e}", file=sys.stderr)
+    finally:
+        if rebuild_indexes:
+            for create_index in _RSS_FEEDS_INDEXES.values():
+                cursor.execute(create_index)
 
-    conn.commit()
     conn.close()
 
     return added_count
@@ -157,7 +195,7 @@ def scan_and_migrate_feeds(db_path: str) -> int:
 
 def add_rss_feed(db_path: str, feed_url: str, source: str = "manual") -> bool:
     """Add a single RSS feed URL to the table."""
-    conn = sqlite3.connect(db_path)
+    conn = connect(db_path)
     cursor = conn.cursor()
 
     domain = urlparse(feed_url).netloc
@@ -183,7 +221,7 @@ def add_rss_feed(db_path: str, feed_url: str, source: str = "manual") -> bool:
 
 def get_all_rss_feeds(db_path: str, active_only: bool = True) -> list:
     """Get all RSS feed URLs from the table."""
-    conn = sqlite3.connect(db_path)
+    conn = connect(db_path)
     cursor = conn.cursor()
 
     if active_only:
@@ -212,7 +250,7 @@ def get_all_rss_feeds(db_path: str, active_only: bool = True) -> list:
 
 def mark_feed_inactive(db_path: str, feed_url: str):
     """Mark a feed as inactive (e.g., if it's no longer accessible)."""
-    conn = sqlite3.connect(db_path)
+    conn = connect(db_path)
     cursor = conn.cursor()
     cursor.execute(
         "UPDATE rss_feeds SET is_active = 0 WHERE url = ?",
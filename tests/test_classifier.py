@@ -0,0 +1,89 @@
+import os
+import tempfile
+import unittest
+import fasttext
+from provoke.ml.classifier import ContentClassifier
+
+GOOD_WORDS = "essay thoughts personal reflection writing my life learned".split()
+BAD_WORDS = "buy now pricing enterprise solutions contact sales demo".split()
+
+
+class TestContentClassifierBatch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # A tiny model trained on two disjoint vocabularies is enough to get
+        # a spread of confident and borderline predictions
+        cls.tmp = tempfile.TemporaryDirectory()
+        train_file = os.path.join(cls.tmp.name, "train.txt")
+        model_path = os.path.join(cls.tmp.name, "model.bin")
+        with open(train_file, "w", encoding="utf-8") as f:
+            for i in range(40):
+                f.write("__label__good " + " ".join(GOOD_WORDS[i % 8 :]) + "\n")
+                f.write("__label__bad " + " ".join(BAD_WORDS[i % 8 :]) + "\n")
+        model = fasttext.train_supervised(
+            input=train_file, epoch=25, lr=1.0, dim=10, thread=1, verbose=0
+        )
+        model.save_model(model_path)
+        cls.classifier = ContentClassifier(model_path)
+
+        cls.texts = [
+            "my personal essay about what I learned",
+            "enterprise pricing, contact sales for a demo",
+            "writing   about\nbuying a demo",
+            "",
+            "   ",
+            "completely unrelated words",
+        ]
+        cls.urls = [
+            "https://blog.example.com/essay",
+            "https://corp.example.com/pricing",
+            "",
+            "https://example.com/",
+            "",
+            "https://example.com/about",
+        ]
+        cls.titles = ["My essay", "Pricing", "", "Home", "", "About us"]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_predict_batch_matches_predict(self):
+        for threshold in (0.0, 0.7):
+            expected = [
+                self.classifier.predict(text, url, title, threshold=threshold)
+                for text, url, title in zip(self.texts, self.urls, self.titles)
+            ]
+            self.assertEqual(
+                self.classifier.predict_batch(
+                    self.texts, self.urls, self.titles, threshold=threshold
+                ),
+                expected,
+            )
+
+    def test_is_acceptable_batch_matches_is_acceptable(self):
+        expected = [
+            self.classifier.is_acceptable(text, url, title)
+            for text, url, title in zip(self.texts, self.urls, self.titles)
+        ]
+        self.assertEqual(
+            self.classifier.is_acceptable_batch(self.texts, self.urls, self.titles),
+            expected,
+        )
+
+    def test_empty_text_without_url_or_title(self):
+        self.assertEqual(
+            self.classifier.predict_batch([""], [""], [""]), [("bad", 1.0)]
+        )
+        self.assertEqual(
+            self.classifier.predict_batch([""], [""], [""]),
+            [self.classifier.predict("", "", "")],
+        )
+
+    def test_empty_batch(self):
+        self.assertEqual(self.classifier.predict_batch([], [], []), [])
+        self.assertEqual(self.classifier.is_acceptable_batch([], [], []), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+from urllib.parse import urlparse
+from provoke.config import BINARY_EXT_RE, check_page_title, config
+
+
+def _crawler_path(url):
+    # AsyncCrawler.is_valid_url matches against the lowercased parsed path
+    return urlparse(url).path.lower()
+
+
+class TestBinaryExtensions(unittest.TestCase):
+
+    def test_binary_paths_match(self):
+        for url in (
+            "https://example.com/file.zip",
+            "https://example.com/IMAGE.JPG",
+            "https://example.com/dist/archive.tar.gz",
+            "https://example.com/setup.exe?download=1",
+            "https://example.com/talk.mp4#t=30",
+            "https://example.com/a/b/slides.PPTX",
+        ):
+            self.assertIsNotNone(BINARY_EXT_RE.search(_crawler_path(url)), url)
+
+    def test_non_binary_paths_do_not_match(self):
+        for url in (
+            "https://example.com/paper.pdf",
+            "https://example.com/PAPER.PDF",
+            "https://example.com/pdf/",
+            "https://example.com/download?file=x.pdf",
+            "https://example.com/download?file=x.zip",
+            "https://example.com/blog/zip-files-explained",
+            "https://example.com/gzip",
+            "https://example.com/notes.html",
+            "https://example.com/",
+            "https://example.com",
+        ):
+            self.assertIsNone(BINARY_EXT_RE.search(_crawler_path(url)), url)
+
+    def test_matches_endswith_for_every_extension(self):
+        for ext in config.BINARY_EXTENSIONS:
+            for path in (f"/file{ext}", f"/FILE{ext.upper()}", f"/file{ext}/", "/x"):
+                path = path.lower()
+                self.assertEqual(
+                    BINARY_EXT_RE.search(path) is not None,
+                    any(path.endswith(e) for e in config.BINARY_EXTENSIONS),
+                    path,
+                )
+
+    def test_tolerates_trailing_query_or_fragment(self):
+        self.assertIsNotNone(BINARY_EXT_RE.search("/file.ZIP?x=1"))
+        self.assertIsNotNone(BINARY_EXT_RE.search("/file.zip#top"))
+        self.assertIsNone(BINARY_EXT_RE.search("/file.zipper"))
+
+
+class TestCheckPageTitle(unittest.TestCase):
+
+    def test_excluded_titles(self):
+        for html in (
+            "<html><head><title>Privacy Policy</title></head></html>",
+            "<TITLE lang='en'>Terms&nbsp;of Service | Example</TITLE>",
+        ):
+            self.assertEqual(check_page_title(html), "Title matched common phrase")
+
+    def test_other_titles(self):
+        for html in (
+            "<title>My thoughts on policy</title>",
+            "<title></title>",
+            "<html><body>Privacy Policy</body></html>",
+        ):
+            self.assertIsNone(check_page_title(html), html)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+from provoke.utils.db import connect, executemany_or_each
+
+INSERT_SQL = "INSERT INTO feeds (url) VALUES (?) ON CONFLICT(url) DO NOTHING"
+
+
+class TestExecutemanyOrEach(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.conn = connect(os.path.join(self.tmp.name, "test.db"))
+        self.conn.execute("CREATE TABLE feeds (url TEXT UNIQUE NOT NULL)")
+
+    def tearDown(self):
+        self.conn.close()
+        self.tmp.cleanup()
+
+    def _urls(self):
+        return [row[0] for row in self.conn.execute("SELECT url FROM feeds")]
+
+    def test_batch_counts_inserted_rows(self):
+        rows = [("https://a.example/rss",), ("https://b.example/rss",)]
+        self.assertEqual(executemany_or_each(self.conn, INSERT_SQL, rows), 2)
+        # Conflicting rows are skipped and not counted
+        rows.append(("https://c.example/rss",))
+        self.assertEqual(executemany_or_each(self.conn, INSERT_SQL, rows), 1)
+        self.assertEqual(len(self._urls()), 3)
+
+    def test_bad_row_only_loses_itself(self):
+        rows = [("https://a.example/rss",), (None,), ("https://b.example/rss",)]
+        errors = []
+        added = executemany_or_each(
+            self.conn, INSERT_SQL, rows, on_error=lambda row, e: errors.append(row)
+        )
+        self.assertEqual(added, 2)
+        self.assertEqual(errors, [(None,)])
+        self.assertEqual(
+            sorted(self._urls()), ["https://a.example/rss", "https://b.example/rss"]
+        )
+
+    def test_bad_row_without_on_error(self):
+        added = executemany_or_each(self.conn, INSERT_SQL, [(None,), ("x",)])
+        self.assertEqual(added, 1)
+        self.assertEqual(self._urls(), ["x"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+import importlib.util
+import os
+import unittest
+from urllib.parse import urljoin
+from lxml import html as lxml_html
+from provoke.utils.feeds import find_alternate_links, join_url
+
+_SCRIPTS = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"
+)
+
+
+def _load_script(name):
+    # scripts/ is not a package; load the script as a module
+    spec = importlib.util.spec_from_file_location(
+        name, os.path.join(_SCRIPTS, f"{name}.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestFindAlternateLinks(unittest.TestCase):
+
+    def test_finds_feed_links(self):
+        html = """
+        <html>
+            <head>
+                <link rel="stylesheet" href="/style.css">
+                <link rel="alternate" type="application/rss+xml"
+                      href="/feed?a=1&amp;b=2" title="Posts &amp; notes">
+                <LINK REL='alternate feed' HREF=/atom.xml>
+            </head>
+        </html>
+        """
+        self.assertEqual(
+            find_alternate_links(html),
+            [
+                {
+                    "rel": "alternate",
+                    "type": "application/rss+xml",
+                    "href": "/feed?a=1&b=2",
+                    "title": "Posts & notes",
+                },
+                {"rel": "alternate feed", "href": "/atom.xml"},
+            ],
+        )
+
+    def test_ignores_links_outside_markup(self):
+        html = """
+        <!-- <link rel="alternate" href="/old.xml"> -->
+        <script>document.write('<link rel="alternate" href="/js.xml">');</script>
+        <div title='<link rel="alternate" href="/attr.xml">'>alternate</div>
+        """
+        self.assertEqual(find_alternate_links(html), [])
+
+    def test_ignores_links_in_raw_text_and_cdata(self):
+        link = '<link rel="alternate" href="/x.xml">'
+        for html in (
+            f"<title>{link}</title>",
+            f"<TITLE lang=en>{link}</TITLE >",
+            f"<textarea>{link}</textarea>",
+            f"<xmp>{link}</xmp>",
+            f"<iframe src=/embed>{link}</iframe>",
+            f"<title>unclosed {link}",
+            f"<![CDATA[{link}]]>",
+            f"<!-- a --!>x<!--{link}-->",
+        ):
+            self.assertEqual(find_alternate_links(html), [], html)
+
+    def test_matches_lxml_around_raw_text_and_comments(self):
+        # lxml ends <![CDATA[ and other "<!" constructs at the first ">",
+        # and treats "<!-->" as an empty comment
+        link = '<link rel="alternate" href="/x.xml">'
+        for html in (
+            f"<title>Blog</title>{link}",
+            f"<title>a</titlex>{link}</title>",
+            f"<![CDATA[ a > b {link} ]]>",
+            f"<!DOCTYPE html>{link}",
+            f"<!-->{link}",
+            f"<!-- a --!>{link}",
+            f"<textarea>a</TEXTAREA>{link}",
+            f"<noscript>{link}</noscript>",
+        ):
+            tree = lxml_html.fromstring(html)
+            expected = [
+                dict(el.attrib)
+                for el in tree.iter("link")
+                if "alternate" in el.get("rel", "").split()
+            ]
+            self.assertEqual(find_alternate_links(html), expected, html)
+
+    def test_quoted_values_may_contain_angle_brackets(self):
+        html = """<link rel="alternate" title="a > b" href="/feed.xml">"""
+        self.assertEqual(
+            find_alternate_links(html),
+            [{"rel": "alternate", "title": "a > b", "href": "/feed.xml"}],
+        )
+
+    def test_rel_is_case_insensitive(self):
+        html = """
+        <LINK REL="Alternate" TYPE="application/rss+xml" HREF="/rss">
+        <link rel="ALTERNATE feed" href="/atom.xml">
+        <link rel="stylesheet" title="Alternate" href="/style.css">
+        """
+        self.assertEqual(
+            [link["href"] for link in find_alternate_links(html)],
+            ["/rss", "/atom.xml"],
+        )
+
+    def test_scripts_find_feeds_with_uppercase_rel(self):
+        html = '<link REL="ALTERNATE" type="application/rss+xml" href="/rss">'
+        base_url = "https://example.com/blog/"
+        for script in ("migrate_rss_feeds", "list_feeds_and_sitemaps"):
+            module = _load_script(script)
+            feeds = module.extract_feeds_from_html(html, base_url)
+            self.assertEqual(
+                [feed["url"] for feed in feeds], ["https://example.com/rss"]
+            )
+
+
+class TestJoinUrl(unittest.TestCase):
+
+    def test_matches_urljoin(self):
+        base = "https://example.com/blog/post-1?page=2"
+        for href in [
+            "/feed.xml",
+            "https://other.org/rss",
+            "http://example.com/a/../feed",
+            "/a//b",
+            "/a/./feed?x=1#top",
+            "//cdn.example.com/feed",
+            "feed.xml",
+            "../feed/",
+            "/feed?",
+        ]:
+            self.assertEqual(join_url(base, href), urljoin(base, href), href)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+import importlib.util
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+# scripts/ is not a package; load the script as a module
+_SCRIPT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "scripts",
+    "index_from_rss.py",
+)
+_spec = importlib.util.spec_from_file_location("index_from_rss", _SCRIPT)
+index_from_rss = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(index_from_rss)
+extract_feed_entries = index_from_rss.extract_feed_entries
+
+FEED_URL = "https://example.com/feed"
+
+RSS_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>Example blog</title>
+    <link>https://example.com/</link>
+    <item>
+      <title> First post </title>
+      <link>
+        https://example.com/first
+      </link>
+    </item>
+    <item>
+      <title>Fish &amp; chips</title>
+      <link>https://example.com/second</link>
+    </item>
+    <item>
+      <title>No link</title>
+    </item>
+  </channel>
+</rss>
+"""
+
+ATOM_FEED = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Example blog</title>
+  <link href="https://example.com/"/>
+  <entry>
+    <title>Atom post</title>
+    <link rel="alternate" href="https://example.com/atom-post"/>
+  </entry>
+  <entry>
+    <title type="html">Second</title>
+    <link href="https://example.com/atom-second"/>
+  </entry>
+</feed>
+"""
+
+NAMESPACED_RSS_FEED = b"""<?xml version="1.0"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns="http://purl.org/rss/1.0/"
+         xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <channel rdf:about="https://example.com/">
+    <title>Example blog</title>
+  </channel>
+  <item rdf:about="https://example.com/rdf-post">
+    <title>RDF post</title>
+    <link>https://example.com/rdf-post</link>
+    <dc:creator>Someone</dc:creator>
+  </item>
+</rdf:RDF>
+"""
+
+
+class TestExtractFeedEntries(unittest.TestCase):
+
+    def test_rss(self):
+        self.assertEqual(
+            extract_feed_entries(RSS_FEED, FEED_URL),
+            [
+                {
+                    "url": "https://example.com/first",
+                    "title": "First post",
+                    "source_feed": FEED_URL,
+                },
+                {
+                    "url": "https://example.com/second",
+                    "title": "Fish & chips",
+                    "source_feed": FEED_URL,
+                },
+            ],
+        )
+
+    def test_atom_link_href(self):
+        self.assertEqual(
+            extract_feed_entries(ATOM_FEED, FEED_URL),
+            [
+                {
+                    "url": "https://example.com/atom-post",
+                    "title": "Atom post",
+                    "source_feed": FEED_URL,
+                },
+                {
+                    "url": "https://example.com/atom-second",
+                    "title": "Second",
+                    "source_feed": FEED_URL,
+                },
+            ],
+        )
+
+    def test_namespaced_rss(self):
+        self.assertEqual(
+            extract_feed_entries(NAMESPACED_RSS_FEED, FEED_URL),
+            [
+                {
+                    "url": "https://example.com/rdf-post",
+                    "title": "RDF post",
+                    "source_feed": FEED_URL,
+                }
+            ],
+        )
+
+    def test_truncated_feed_keeps_complete_entries(self):
+        content = RSS_FEED[: RSS_FEED.index(b"<item>\n      <title>No link")]
+        urls = [entry["url"] for entry in extract_feed_entries(content, FEED_URL)]
+        self.assertEqual(
+            urls, ["https://example.com/first", "https://example.com/second"]
+        )
+
+    def test_empty_and_malformed_input(self):
+        for content in [
+            b"",
+            b"  \n\t",
+            b"\x00",
+            b"<",
+            b"not a feed at all",
+            b"\xff\xfe\x00\x00garbage",
+            b"<html><body><h1>404 Not Found</h1></body></html>",
+            b"<?xml version='1.0'?>",
+        ]:
+            self.assertEqual(extract_feed_entries(content, FEED_URL), [], content)
+
+
+class TestDbConnections(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "pages.db")
+
+    def tearDown(self):
+        index_from_rss.close_db_connections()
+        self.tmp.cleanup()
+
+    def test_close_db_connections_closes_every_thread(self):
+        main_conn = index_from_rss.get_db_connection(self.db_path)
+        self.assertIs(index_from_rss.get_db_connection(self.db_path), main_conn)
+
+        worker_conns = []
+        worker = threading.Thread(
+            target=lambda: worker_conns.append(
+                index_from_rss.get_db_connection(self.db_path)
+            )
+        )
+        worker.start()
+        worker.join()
+        self.assertIsNot(worker_conns[0], main_conn)
+
+        index_from_rss.close_db_connections()
+        for conn in (main_conn, worker_conns[0]):
+            with self.assertRaises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+
+        # The next call opens a fresh connection
+        conn = index_from_rss.get_db_connection(self.db_path)
+        self.assertIsNot(conn, main_conn)
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM pages").fetchone(), (0,))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import csv
+import gc
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from provoke.utils.logger import QualityLogger
+
+
+class TestQualityLogger(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self.tmp.name, "rejected.log")
+        self.csv_file = os.path.join(self.tmp.name, "stats.csv")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _make_logger(self):
+        return QualityLogger(log_file=self.log_file, csv_file=self.csv_file)
+
+    def _csv_urls(self):
+        with open(self.csv_file, newline="", encoding="utf-8") as f:
+            return [row[0] for row in csv.reader(f)][1:]
+
+    def _log_rejections(self, quality_logger, count):
+        urls = [f"https://example.com/{i}" for i in range(count)]
+        for url in urls:
+            quality_logger.log_rejection(url, ["Corporate page"], {"word_count": 10})
+        return urls
+
+    def _log_lines(self):
+        with open(self.log_file, encoding="utf-8") as f:
+            return f.read().splitlines()
+
+    def test_instances_share_one_handler(self):
+        root_handlers = list(logging.getLogger().handlers)
+        first = self._make_logger()
+        second = self._make_logger()
+        self.assertEqual(logging.getLogger().handlers, root_handlers)
+
+        first.log_acceptance("https://example.com/a", "high")
+        second.log_rejection("https://example.com/b", ["Corporate page"], {})
+        first.stop()
+        second.log_acceptance("https://example.com/c", "low")
+        second.stop()
+
+        lines = self._log_lines()
+        self.assertEqual(len(lines), 3)
+        self.assertIn("ACCEPTED: https://example.com/a - Tier: high", lines[0])
+        self.assertIn("REJECTED: https://example.com/b", lines[1])
+        self.assertIn("ACCEPTED: https://example.com/c - Tier: low", lines[2])
+
+    def test_stop_is_idempotent(self):
+        quality_logger = self._make_logger()
+        quality_logger.stop()
+        quality_logger.stop()
+
+        # A fresh instance starts logging again after the last one stopped
+        quality_logger = self._make_logger()
+        quality_logger.log_acceptance("https://example.com/a", "medium")
+        quality_logger.stop()
+        self.assertEqual(len(self._log_lines()), 1)
+
+    def test_stop_writes_buffered_rows(self):
+        quality_logger = self._make_logger()
+        urls = self._log_rejections(quality_logger, 7)
+        quality_logger.stop()
+        self.assertEqual(self._csv_urls(), urls)
+
+    def test_logging_after_stop_is_a_no_op(self):
+        quality_logger = self._make_logger()
+        urls = self._log_rejections(quality_logger, 3)
+        quality_logger.stop()
+
+        quality_logger.log_rejection("https://example.com/late", ["Corporate page"], {})
+        quality_logger.log_acceptance("https://example.com/late-ok", "high")
+        self.assertEqual(quality_logger.stats["rejected"], 4)
+        self.assertEqual(quality_logger.stats["accepted"], 1)
+        self.assertEqual(self._csv_urls(), urls)
+
+    def test_rows_written_when_logger_is_dropped(self):
+        quality_logger = self._make_logger()
+        urls = self._log_rejections(quality_logger, 7)
+        del quality_logger
+        gc.collect()
+        self.assertEqual(self._csv_urls(), urls)
+
+    def test_rows_written_at_exit_without_stop(self):
+        script = (
+            "import sys\n"
+            "from provoke.utils.logger import QualityLogger\n"
+            "ql = QualityLogger(log_file=sys.argv[1], csv_file=sys.argv[2])\n"
+            "ql.log_rejection('https://example.com/0', ['Corporate page'], {})\n"
+        )
+        subprocess.run(
+            [sys.executable, "-c", script, self.log_file, self.csv_file],
+            check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        )
+        self.assertEqual(self._csv_urls(), ["https://example.com/0"])
+        self.assertEqual(len(self._log_lines()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
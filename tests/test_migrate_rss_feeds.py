@@ -0,0 +1,106 @@
+import importlib.util
+import os
+import sqlite3
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest import mock
+
+# scripts/ is not a package; load the script as a module
+_SCRIPT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "scripts",
+    "migrate_rss_feeds.py",
+)
+_spec = importlib.util.spec_from_file_location("migrate_rss_feeds", _SCRIPT)
+migrate_rss_feeds = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(migrate_rss_feeds)
+
+
+def _page(*feed_paths):
+    links = "".join(
+        f'<link rel="alternate" type="application/rss+xml" href="{path}">'
+        for path in feed_paths
+    )
+    return f"<html><head>{links}</head><body></body></html>"
+
+
+class TestScanAndMigrateFeeds(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "crawler.db")
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE TABLE pages (url TEXT UNIQUE, html TEXT)")
+        conn.commit()
+        conn.close()
+        with redirect_stdout(StringIO()):
+            migrate_rss_feeds.init_rss_feeds_table(self.db_path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _add_pages(self, pages):
+        conn = sqlite3.connect(self.db_path)
+        conn.executemany("INSERT INTO pages VALUES (?, ?)", pages)
+        conn.commit()
+        conn.close()
+
+    def _scan(self):
+        """Run a scan; return (added count, SQL statements it executed)."""
+        statements = []
+        connect = migrate_rss_feeds.connect
+
+        def traced_connect(db_path):
+            conn = connect(db_path)
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        with mock.patch.object(migrate_rss_feeds, "connect", traced_connect):
+            with redirect_stdout(StringIO()):
+                added = migrate_rss_feeds.scan_and_migrate_feeds(self.db_path)
+        return added, statements
+
+    def _index_names(self):
+        conn = sqlite3.connect(self.db_path)
+        rows = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' "
+            "AND tbl_name = 'rss_feeds' AND name LIKE 'idx_%'"
+        ).fetchall()
+        conn.close()
+        return {row[0] for row in rows}
+
+    def _drops_indexes(self, statements):
+        return any(sql.startswith("DROP INDEX") for sql in statements)
+
+    def test_rescan_keeps_indexes(self):
+        # Every page of the site repeats the same two feeds
+        self._add_pages(
+            (f"https://example.com/post-{i}", _page("/rss.xml", "/comments.xml"))
+            for i in range(10)
+        )
+        added, statements = self._scan()
+        self.assertEqual(added, 2)
+        self.assertTrue(self._drops_indexes(statements))
+
+        added, statements = self._scan()
+        self.assertEqual(added, 0)
+        self.assertFalse(self._drops_indexes(statements))
+        self.assertEqual(self._index_names(), set(migrate_rss_feeds._RSS_FEEDS_INDEXES))
+
+    def test_small_top_up_keeps_indexes(self):
+        self._add_pages(
+            (f"https://site{i}.example/", _page("/rss.xml")) for i in range(3)
+        )
+        self._scan()
+
+        self._add_pages([("https://new.example/", _page("/rss.xml"))])
+        added, statements = self._scan()
+        self.assertEqual(added, 1)
+        self.assertFalse(self._drops_indexes(statements))
+        self.assertEqual(self._index_names(), set(migrate_rss_feeds._RSS_FEEDS_INDEXES))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,12 @@
 import unittest
-from provoke.config import evaluate_page_quality
+from provoke.config import evaluate_page_quality, quality_cache_info
 
 
 class TestQualityFilter(unittest.TestCase):
-    def test_personal_blog(self):
-        url = "https://danluu.com/productivity/"
-        html = (
+    @classmethod
+    def setUpClass(cls):
+        # Build the large page fixtures once per run, not once per test
+        cls.BLOG_HTML = (
             """
         <html>
         <head>
@@ -37,7 +38,7 @@ class TestQualityFilter(unittest.TestCase):
         </html>
         """
         )
-        text = (
+        cls.BLOG_TEXT = (
             "Productivity. I've been thinking about productivity lately. Many people ask me how I get so much done. "
             + "First, I try to avoid meetings. Meetings are a waste of time generally. I prefer async communication. When I was working at Google, I noticed that the most productive people weren't the ones who worked the longest hours. Instead, they were the ones who were best at prioritizing their work and saying no to unimportant tasks. This is something that I've tried to emulate in my own life. I also think it's important to have a good workspace. For me, that means a quiet room with a comfortable chair and a large monitor. Some people prefer working in coffee shops, but I find the noise too distracting. It's all about finding what works for you. Another key factor is getting enough sleep. I try to get at least eight hours of sleep every night. If I don't get enough sleep, I find it much harder to concentrate and I'm much less productive. It's better to work fewer hours and be more focused than to work more hours and be tired. Finally, I think it's important to take breaks. I try to take a short break every hour or so to stretch and move around. This helps to keep me energized and prevents me from getting burnt out. Even just a few minutes of walking can make a big difference. "
             + "This is a filler sentence to reach the minimum word count requirement for the test case. "
@@ -45,16 +46,7 @@ class TestQualityFilter(unittest.TestCase):
             + " Last updated: January 15, 2024. By Dan Luu."
         )
 
-        result = evaluate_page_quality(url, html, text)
-        self.assertTrue(
-            result["is_acceptable"],
-            f"Should accept personal blog. Reasons: {result['rejection_reasons']}",
-        )
-        self.assertGreaterEqual(result["scores"]["personal_signals"], 3)
-
-    def test_corporate_marketing(self):
-        url = "https://www.salesforce.com/blog/customer-success/"
-        html = (
+        cls.CORPORATE_HTML = (
             """
         <html>
         <head>
@@ -80,11 +72,26 @@ class TestQualityFilter(unittest.TestCase):
         </html>
         """
         )
-        text = (
+        cls.CORPORATE_TEXT = (
             "Customer Success Strategies In today's fast-paced market, businesses need a robust CRM. Book a demo. Get Started Free Trial Talk to Sales Request Demo Schedule a Call Contact Sales "
             + "CRM Solutions " * 100
         )
 
+    def test_personal_blog(self):
+        url = "https://danluu.com/productivity/"
+        html, text = self.BLOG_HTML, self.BLOG_TEXT
+
+        result = evaluate_page_quality(url, html, text)
+        self.assertTrue(
+            result["is_acceptable"],
+            f"Should accept personal blog. Reasons: {result['rejection_reasons']}",
+        )
+        self.assertGreaterEqual(result["scores"]["personal_signals"], 3)
+
+    def test_corporate_marketing(self):
+        url = "https://www.salesforce.com/blog/customer-success/"
+        html, text = self.CORPORATE_HTML, self.CORPORATE_TEXT
+
         result = evaluate_page_quality(url, html, text)
         self.assertFalse(result["is_acceptable"], "Should reject corporate marketing")
         self.assertIn("Corporate page", str(result["rejection_reasons"]))
@@ -105,6 +112,17 @@ class TestQualityFilter(unittest.TestCase):
         self.assertFalse(result["is_acceptable"])
         self.assertTrue(any("length" in r for r in result["rejection_reasons"]))
 
+    def test_repeat_evaluation_is_cached(self):
+        url = "https://example.com/cached"
+        html = "<html><body><p>Same page, scored twice.</p></body></html>"
+        text = "Same page, scored twice."
+        first = evaluate_page_quality(url, html, text)
+        first["rejection_reasons"].append("mutated by caller")
+        hits = quality_cache_info()["hits"]
+        second = evaluate_page_quality(url, html, text)
+        self.assertEqual(quality_cache_info()["hits"], hits + 1)
+        self.assertNotIn("mutated by caller", second["rejection_reasons"])
+
 
 if __name__ == "__main__":
     unittest.main()
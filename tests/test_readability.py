@@ -0,0 +1,68 @@
+import unittest
+from provoke.config import _count_syllables, calculate_readability
+
+# Reference values from textstat 0.7 backed by nltk's cmudict, which
+# calculate_readability replaces.
+TEXTSTAT_SYLLABLES = {
+    "the": 1,
+    "file": 1,
+    "while": 1,
+    "makes": 1,
+    "jumped": 1,
+    "create": 2,
+    "science": 2,
+    "table": 2,
+    "being": 2,
+    "wanted": 2,
+    "boxes": 2,
+    "quiet": 2,
+    "poem": 2,
+    "people": 2,
+    "value": 2,
+    "issue": 2,
+    "likely": 2,
+    "useful": 2,
+    "statement": 2,
+    "idea": 3,
+    "video": 3,
+    "radio": 3,
+    "created": 3,
+    "enabled": 3,
+    "specified": 3,
+    "examples": 3,
+    "usually": 4,
+    "automatically": 5,
+}
+
+TEXTSTAT_FLESCH = {
+    "The cat sat on the mat. It was a sunny day.": 108.96159090909092,
+    "I've been thinking about productivity lately. "
+    "Many people ask me how I get so much done.": 66.5275,
+    "Scientists create new theories to explain the diet of ancient animals. "
+    "The results were quiet but useful.": 53.889852941176486,
+    "Our comprehensive enterprise solutions leverage synergistic cloud "
+    "infrastructure to maximize stakeholder value.": -37.994999999999976,
+    "Hi. This is a very short test! Does it work? Yes.": 108.96159090909092,
+    "The radio played a video about the poem; the poet was cruel, "
+    "and the audience stayed quiet.": 50.2388235294118,
+}
+
+
+class TestReadability(unittest.TestCase):
+
+    def test_syllable_counts_match_textstat(self):
+        for word, expected in TEXTSTAT_SYLLABLES.items():
+            self.assertEqual(_count_syllables(word), expected, word)
+
+    def test_flesch_scores_match_textstat(self):
+        for text, expected in TEXTSTAT_FLESCH.items():
+            self.assertAlmostEqual(calculate_readability(text), expected, 6, text)
+
+    def test_empty_text_scores_zero(self):
+        self.assertEqual(calculate_readability(""), 0.0)
+        self.assertEqual(calculate_readability("  \n"), 0.0)
+        self.assertEqual(calculate_readability("..."), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()